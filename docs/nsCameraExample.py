@@ -18,7 +18,10 @@ contributions must be made under this license.
 Version: 2.1.1  (July 2021)
 """
 
+import sys
+
 from nsCamera.CameraAssembler import CameraAssembler
+from nsCamera.utils.FrameWriter import FrameWriter
 
 #### (1) Initialization (REQUIRED) #####################################################
 #
@@ -72,14 +75,52 @@ ca.setManualShutters(
 ###########
 
 #######
-# setPotV (potname, voltage) - Voltage is float
-#   setPotV sets contents of pot 'potname' to the value corresponding to 'voltage'
-#     based on board.monVmin and board.monVmax
-#   Valid 'name' entries are listed as keys in the 'channel_lookups' dictionary in the
-#     board code
-ca.setPotV("HST_RO_IBIAS", 2.5)  # set ring oscillator frequency
+# batch()
+#   Register writes made inside a 'with ca.batch():' block are queued and submitted
+#     together when the block exits; subregister writes to the same register share a
+#     single register read. Reads made inside the block submit any queued writes
+#     first; setPotV with tune=True writes each pot change immediately.
+with ca.batch():
+    #######
+    # setPotV (potname, voltage) - Voltage is float
+    #   setPotV sets contents of pot 'potname' to the value corresponding to 'voltage'
+    #     based on board.monVmin and board.monVmax
+    #   Valid 'name' entries are listed as keys in the 'channel_lookups' dictionary in
+    #     the board code
+    ca.setPotV("HST_RO_IBIAS", 2.5)  # set ring oscillator frequency
+
+    #######
+    # setPot (name, val) - 'val' is float where 0.0 <= val < 1.0
+    #   setPot sets contents of register or subregister object 'name' to (int)val * max
+    #     where 'max' is the maximum possible value, e.g., for a single byte
+    #     subregister, max = 0xFF; val = 0.5 results in the subregister being set to
+    #     0x80
+    #   Valid 'name' entries are listed as keys in the 'channel_lookups' dictionary in
+    #     the board code
+    ca.setPot("HST_B_NDELAY", 1)
+
+    #######
+    # setRegister (name, hexString)
+    #   setRegister sets contents of register 'name' to hexString
+    #   Valid 'name' entries are listed as keys in the 'registers' dictionary in the
+    #     board code
+    ca.setRegister("LED_GP", "000000FF")  # light all general purpose LEDs
+
+    #######
+    # setSubregister (name, bitString)
+    #   setRegister sets contents of subregister 'name' to bitString
+    #   Valid 'name' entries are listed as keys in the 'channel_lookups' dictionary in
+    #     the board code
+    ca.setSubregister("COLQUENCHEN", "0")  # disable column quench function.
+
+#######
+# channel (potname)
+#   channel returns a handle to pot 'potname' whose name is resolved only once; its
+#     setV/getV/monV (and set/get) methods correspond to setPotV/getPotV/getMonV (and
+#     setPot/getPot). Useful for repeated access, e.g., in parameter sweeps
+osc = ca.channel("HST_OSC_CTL")
 # set relaxation oscillator frequency, use monitor to tune actual voltage
-ca.setPotV("HST_OSC_CTL", 1.45, tune=True)
+osc.setV(1.45, tune=True)
 
 #######
 # getPotV (potname)
@@ -100,15 +141,6 @@ print(
     "HST_A_NDELAY monitor voltage: " + str(ca.getMonV("HST_A_NDELAY"))
 )
 
-#######
-# setPot (name, val) - 'val' is float where 0.0 <= val < 1.0
-#   setPot sets contents of register or subregister object 'name' to (int)val * max
-#     where 'max' is the maximum possible value, e.g., for a single byte subregister,
-#     max = 0xFF; val = 0.5 results in the subregister being set to 0x80
-#   Valid 'name' entries are listed as keys in the 'channel_lookups' dictionary in the
-#     board code
-ca.setPot("HST_B_NDELAY", 1)
-
 #######
 # getPot (name)
 #   getPot returns the contents of register or subregister object 'name'
@@ -124,13 +156,6 @@ print(
     "HST_B_NDELAY monitor voltage: " + str(ca.getMonV("HST_B_NDELAY"))
 )  # read ADC monitor 8
 
-#######
-# setRegister (name, hexString)
-#   setRegister sets contents of register 'name' to hexString
-#   Valid 'name' entries are listed as keys in the 'registers' dictionary in the board
-#     code
-ca.setRegister("LED_GP", "000000FF")  # light all general purpose LEDs
-
 #######
 # getRegister (name)
 #   getRegister returns contents of register 'name' as hexstring
@@ -138,13 +163,6 @@ ca.setRegister("LED_GP", "000000FF")  # light all general purpose LEDs
 #     code
 print("Timer: " + ca.getRegister("TIMER_VALUE")[1])  # prints contents of timer counter
 
-#######
-# setSubregister (name, bitString)
-#   setRegister sets contents of subregister 'name' to bitString
-#   Valid 'name' entries are listed as keys in the 'channel_lookups' dictionary in the
-#     board code
-ca.setSubregister("COLQUENCHEN", "0")  # disable column quench function.
-
 #######
 # getSubregister (name)
 #   getSubregister returns contents of subregister 'name' as bit string
@@ -171,9 +189,13 @@ ca.arm("SOFTWARE")
 if data_err:
     print("Error in data acquisition!")
 
-ca.saveTiffs(frames)  # save images to disk as tiffs
-ca.saveNumpys(frames)  # save images to disk as numpy data files
+# save images to disk as tiffs and as numpy data files in background threads while the
+#   plots are generated; for repeated acquisitions, keep submitting frames to the same
+#   writer and join it once at the end
+writer = FrameWriter(ca, [ca.saveTiffs, ca.saveNumpys])
+writer.submit(frames)
 ca.plotFrames(frames)  # generate plots of images
+writer.join()  # wait for all files to be written
 
 ### (4) Miscellaneous (OPTIONAL) #######################################################
 #
@@ -181,20 +203,27 @@ ca.plotFrames(frames)  # generate plots of images
 #
 ###########
 
+# reads on-board timer (seconds since power-up or reset), temperature sensor, and status
+#   register together; ca.getTimer(), ca.getTemp(), and ca.status() read them separately
+timer, temp, status = ca.snapshot()
+
 # bits of status register in reverse order (i.e., the contents of bit '0' of the
-#   register is at ca.checkStatus()[0]
-print("Status bits: " + ca.checkStatus())
+#   register is the first character; ca.checkStatus() returns the same string); the
+#   report is assembled first and written to the console at once
+sys.stdout.write(
+    "\n".join(
+        [
+            "Status bits: " + "{0:032b}".format(status)[::-1],
+            "Timer: {0}".format(timer),
+            "Temperature reading: {0} C".format(temp),
+        ]
+    )
+    + "\n"
+)
 ca.reportStatus()  # prints brief report based on contents of status register
-
-# reads on-board timer (seconds since power-up or reset)
-print("Timer: " + str(ca.getTimer()))
 ca.resetTimer()  # reset on-board timer
 
-# reads on-board temperature sensor (if available)
-print("Temperature reading: " + str(ca.getTemp()) + " C")
-
-print("\n\nRegister dump:\n")
-print("\n".join(ca.dumpRegisters()))
+sys.stdout.write("\n\nRegister dump:\n\n" + "\n".join(ca.dumpRegisters()) + "\n")
 
 ### (6) Shutdown (REQUIRED) ############################################################
 #
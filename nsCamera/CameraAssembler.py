@@ -22,17 +22,19 @@ contributions must be made under this license.
 Version: 2.1.1  (July 2021)
 """
 
-from __future__ import absolute_import
-
 import binascii
-import collections
+import collections.abc
+import contextlib
 import importlib
 import inspect
+import io
 import logging
 import os
 import platform
 import socket
+import struct
 import sys
+import tempfile
 import time
 from datetime import datetime
 
@@ -41,8 +43,28 @@ import numpy as np
 from PIL import Image
 
 from nsCamera.utils import crc16pure
+from nsCamera.utils.Channel import Channel
+from nsCamera.utils.FrameWriter import FrameWriter
 from nsCamera.utils.Packet import Packet
 
+# Accepted names (lowercase) of boards, sensors, and comms interfaces: (canonical name,
+#   module, class); names not listed here are looked up in the corresponding package
+_BOARD_REGISTRY = {
+    "llnl_v1": ("llnl_v1", "nsCamera.boards.LLNL_v1", "llnl_v1"),
+    "llnlv1": ("llnl_v1", "nsCamera.boards.LLNL_v1", "llnl_v1"),
+    "llnl_v4": ("llnl_v4", "nsCamera.boards.LLNL_v4", "llnl_v4"),
+    "llnlv4": ("llnl_v4", "nsCamera.boards.LLNL_v4", "llnl_v4"),
+}
+_SENSOR_REGISTRY = {
+    "icarus": ("icarus", "nsCamera.sensors.icarus", "icarus"),
+    "icarus2": ("icarus2", "nsCamera.sensors.icarus2", "icarus2"),
+    "daedalus": ("daedalus", "nsCamera.sensors.daedalus", "daedalus"),
+}
+_COMMS_REGISTRY = {
+    "gige": ("gige", "nsCamera.comms.GigE", "GigE"),
+    "rs422": ("rs422", "nsCamera.comms.RS422", "RS422"),
+}
+
 
 class CameraAssembler:
     """
@@ -52,36 +74,69 @@ class CameraAssembler:
         initialize() - initializes board registers and pots, sets up sensor
         reinitialize() - initialize board and sensors, restore last known timer settings
         reboot() - perform software reset of board and reinitialize
+        bindAliases(obj, names) - bind alias names directly to methods of board, sensor,
+          or comms object
+        lookupName(name, registry, package) - normalize board, sensor, or comms name
+        loadClass(modname, classname, kind) - import board, sensor, or comms class
         getBoardInfo() - parses FPGA_NUM register to retrieve board description
         getRegister(regname) - retrieves contents of named register
         setRegister(regname, string) - sets named register to given value
+        getRegisters(regnames) - retrieves contents of list of registers
+        readPacket(addr) - returns (reused) read packet for register address
+        setRegisters(messages) - sets list of registers to given values
         resolveSubreg(srname) - resolves alias and retrieves object associated with
           srname
         getSubregister(subregname) - return substring of register identified in board
           attribute 'subregname'
+        getSubregisterInt(subregname) - return contents of subregister as integer
+        readSubregister(subregobj) - return contents of resolved subregister as integer
+        getSubregisters(subregnames) - return substrings for list of subregisters,
+          reading each register once
         setSubregister(subregname, valstring) - replace substring of register identified
-          in board attribute 'subregname' with 'valstring'
+          in board attribute 'subregname' with 'valstring' (binary string or integer)
+        writeSubregister(subregobj, valstring) - set resolved subregister
         submitMessages(messages) - set registers or subregisters based on list of
           destination/payload tuples
+        batch() - context manager; queues register and subregister writes and submits
+          them together on exit
+        flushBatch() - submit queued register and subregister writes
         getPot(potname) - returns float (0 < value < 1) corresponding to integer stored
           in pot or monitor 'potname'
         setPot(potname, value) - 0 < value < 1; sets named pot to fixed-point number =
           'value' * (maximum pot value)
         getPotV(potname) - returns voltage setting of 'potname'
         setPotV(potname, voltage) - sets named pot to voltage
+        sweepPotV(potname, voltages) - sets named pot to each voltage in turn, returns
+          monitor readings
+        potLatch(potname) - returns control register and value that latch pot setting
+        writePot(potobj, setpoint, latch) - write resolved pot and latch it together
         getMonV(monname) - returns voltage read by monitor 'monname' (or monitor
           associated with given potname)
+        averageMonitor(monname, samples) - returns mean of monitor readings taken one
+          ADC polling period apart
+        monToV(monval) - converts monitor reading to voltage
+        resolveMonitor(monname) - resolves alias and returns name of monitor associated
+          with 'monname'
+        channel(name) - returns Channel handle for repeated access to pot or monitor
         readImgs() - calls arm() and readoff() functions
         deInterlace(frames, interlacing) - extract interlaced frames
+        makePath(path) - create output directory if needed
+        timePrefix() - return default filename prefix from current date/time
         saveFrames(frames) - save image object as one file
         saveTiffs(frames) - save individual frames as tiffs
         saveNumpys(frames) - save individual frames as numpy data files
-        dumpNumpy(datastream) - save datastream string to numpy file
+        npyHeader(dtype, shape) - return numpy file header for array
+        saveRaw(frames) - save frames to memory-mapped numpy file, return mapping
+        dumpNumpy(datastream) - save datastream string (or bytes) to numpy file
         plotFrames(frames) - plot individual frames as tiffs
         checkCRC(string) - checks last four characters of string is valid CRC for rest
           of string
         checkRegSet(register, string) - test set and get register functions for named
           register
+        checkRegSets(messages) - test set and get register functions for list of
+          registers
+        regDiff(resp, teststring) - return bits that differ between register contents
+          read and written
         initPowerCheck() - start timers for power continutity check
         powerCheck(delta) - check that board power has not failed
         dummyCheck(image, margin) - counts how many pixels differ from expected dummy
@@ -92,14 +147,17 @@ class CameraAssembler:
         str2bytes(string) - convert hexadecimal string to byte string
         bytes2str(sequence) - convert byte sequence to hexadecimal string
         str2nparray(string) - convert string of hexadecimal values into uint16 array
+        allocateFrameBuffers(count) - preallocate reusable buffers for readoff
+        releaseFrames(frames) - return frames' buffer to the pool for reuse
         flatten(llist) - flattens list of lists into single list
         getEnter(text) - print text, then wait for Enter keypress
         mmReadoff(waitflag, variation) - convenience function for MicroManager plugin
         setFrames(min, max) - select subset of frames for readoff
         setRows(min, max, fullsize) - select subset of rows for readoff
-        generateFrames(data) - processes data stream from board into frames
+        generateFrames(data, pooled) - processes data stream from board into frames
         abortReadoff() - cancel readoff in wait-for-SRAM loop
         batchAquire() - fast acquire a finite series of images
+        setPrefix(settime) - filename prefix for one batchAcquire set
         loadTextFrames() - load data sets previously saved as text and convert to frames
 
     Includes aliases to board- and sensor- specific functions:
@@ -114,6 +172,8 @@ class CameraAssembler:
             readSRAM() - trigger read from SRAM
             waitForSRAM() - puts board in wait state until data are ready in SRAM
             clearStatus() - clear contents of status registers
+            status() - read status register 1 as integer
+            status2() - read status register 2 as integer
             checkStatus() - print contents of status register as reversed bit string
             checkStatus2() - print contents of status register 2 as reversed bit string
             reportStatus() - print report on contents of status registers
@@ -125,6 +185,9 @@ class CameraAssembler:
               (status = 0)
             getPressure() - read on-board pressure sensor
             getTemp() - read on-board temperature sensor
+            snapshot() - read timer, temperature, and status register in one exchange
+            status() - read and return status register 1 as integer
+            status2() - read and return status register 2 as integer
             checkStatus() - read and return status bits in status register 1
             checkStatus2() - read and return status bits in status register 2
             clearStatus() - clear status registers 1 and 2
@@ -177,6 +240,7 @@ class CameraAssembler:
         ip=None,
         logfile=None,
         logtag=None,
+        rcvbuf=None,
     ):
         """
         Args:
@@ -205,6 +269,9 @@ class CameraAssembler:
                   required for some operating systems
             logfile: optional string, name of file to divert console output
             errtag: suffix to add to logging labels
+            rcvbuf: optional integer
+                GigE: requested TCP receive buffer size in bytes (default: left to the
+                  OS, which on Linux tunes it automatically)
         """
         self.version = "2.1.1"
         self.currtime = 0
@@ -216,17 +283,18 @@ class CameraAssembler:
         self.parsedtime = []
         self.savetime = []
         self.cycle = []
-        self.boardname = boardname.lower()
-        if self.boardname == "llnlv1":
-            self.boardname = "llnl_v1"
-        if self.boardname == "llnlv4":
-            self.boardname = "llnl_v4"
-        self.commname = commname.lower()
-        self.sensorname = sensorname.lower()
+        self.boardname, self.boardmod, self.boardclass = self.lookupName(
+            boardname, _BOARD_REGISTRY, "boards"
+        )
+        self.commname, self.commsmod, self.commsclass = self.lookupName(
+            commname, _COMMS_REGISTRY, "comms"
+        )
+        self.sensorname, self.sensormod, self.sensorclass = self.lookupName(
+            sensorname, _SENSOR_REGISTRY, "sensors"
+        )
         self.verbose = verbose
         self.port = port
-        self.python, self.pyth1, self.pyth2, _, _ = sys.version_info
-        self.PY3 = self.python >= 3
+        self.rcvbuf = rcvbuf
         self.platform = platform.system()
         self.arch, _ = platform.architecture()
 
@@ -253,6 +321,18 @@ class CameraAssembler:
         self.inittime = 0
         self.padToFull = False
         self.abort = False
+        self.batching = False  # queue register writes instead of sending immediately
+        self.batchqueue = []
+        self.framepool = []  # reusable frame buffers, see allocateFrameBuffers
+        self.framepoolids = {}  # id -> buffer; holding the buffers keeps ids unique
+        self.channels = {}  # Channel objects created by channel()
+        self.potcals = {}  # pot tuning calibrations, see setPotV
+        self.readpkts = {}  # read packets by register address, see readPacket
+        self.subregcache = {}  # resolved subregisters by name, see resolveSubreg
+        self.monitorpots = {}  # monitor names by pot name, see resolveMonitor
+        self.msghandlers = {}  # setter and resolved name by name, see submitMessages
+        self.potlatches = {}  # latch register and value by pot name, see potLatch
+        self.savepaths = set()  # output directories known to exist, see makePath
 
         self.verbmap = {
             0: 99,
@@ -292,143 +372,83 @@ class CameraAssembler:
             except socket.error:
                 logging.critical(self.logcrit + "CameraAssembler: invalid IP provided")
                 sys.exit(1)
-            ipnum = [0, 0, 0, 0]
-            for i in range(4):
-                if self.PY3:
-                    ipnum[i] = iphex[i]
-                else:
-                    ipnum[i] = int(iphex[i].encode("hex"), 16)
-            self.iplist = ipnum
+            self.iplist = list(struct.unpack("4B", iphex))
+
+        # import modules once; initialize() (and so reinitialize) reuses the classes
+        self.sensorcls = self.loadClass(self.sensormod, self.sensorclass, "sensor")
+        self.commscls = self.loadClass(self.commsmod, self.commsclass, "comms")
+        self.boardcls = self.loadClass(self.boardmod, self.boardclass, "board")
 
         self.payloaderror = False
         self.initialize()
 
-    ##### Aliases to other objects' methods
-
-    def initBoard(self):
-        return self.board.initBoard()
-
-    def initPots(self):
-        return self.board.initPots()
-
-    def latchPots(self):
-        return self.board.latchPots()
-
-    def initSensor(self):
-        return self.board.initSensor()
-
-    def configADCs(self):
-        return self.board.configADCs()
-
-    def disarm(self):
-        return self.board.disarm()
-
-    def startCapture(self, mode):
-        return self.board.startCapture(mode)
-
-    def readSRAM(self):
-        return self.board.readSRAM()
-
-    def waitForSRAM(self, timeout=None):
-        return self.board.waitForSRAM(timeout)
-
-    def getTimer(self):
-        return self.board.getTimer()
-
-    def resetTimer(self):
-        return self.board.resetTimer()
-
-    def enableLED(self, status=1):
-        return self.board.enableLED(status)
-
-    def setLED(self, LED=1, status=1):
-        return self.board.setLED(LED, status)
-
-    def setPowerSave(self, status=1):
-        return self.board.setPowerSave(status)
-
-    def setPPER(self, time=None):
-        return self.board.setPPER(time)
-
-    def getTemp(self, scale=None):
-        return self.board.getTemp(scale)
-
-    def getPressure(self, offset=None, sensitivity=None, units=None):
-        return self.board.getPressure(offset, sensitivity, units)
-
-    def clearStatus(self):
-        return self.board.clearStatus()
-
-    def checkStatus(self):
-        return self.board.checkStatus()
-
-    def checkStatus2(self):
-        return self.board.checkStatus2()
-
-    def reportStatus(self):
-        return self.board.reportStatus()
-
-    def reportEdgeDetects(self):
-        return self.board.reportEdgeDetects()
-
-    def dumpStatus(self):
-        return self.board.dumpStatus()
+    ##### Aliases to other objects' methods; initialize() binds each name listed here
+    #   directly to the method of the current board, sensor, or comms object so that
+    #   calls do not pass through a forwarding method
+
+    _BOARD_ALIASES = (
+        "initBoard",
+        "initPots",
+        "latchPots",
+        "initSensor",
+        "configADCs",
+        "disarm",
+        "startCapture",
+        "readSRAM",
+        "waitForSRAM",
+        "getTimer",
+        "resetTimer",
+        "enableLED",
+        "setLED",
+        "setPowerSave",
+        "setPPER",
+        "getTemp",
+        "snapshot",
+        "getPressure",
+        "clearStatus",
+        "status",
+        "status2",
+        "checkStatus",
+        "checkStatus2",
+        "reportStatus",
+        "reportEdgeDetects",
+        "dumpStatus",
+    )
+
+    _SENSOR_ALIASES = (
+        "checkSensorVoltStat",
+        "setTiming",
+        "setArbTiming",
+        "getTiming",
+        "setManualShutters",
+        "getManualTiming",
+        "sensorSpecific",
+        "setInterlacing",
+        "setHighFullWell",
+        "setZeroDeadTime",
+        "setTriggerDelay",
+        "parseReadoff",
+    )
+
+    _COMMS_ALIASES = (
+        "sendCMD",
+        "arm",
+        "readoff",
+        "writeSerial",
+        "readSerial",
+        "closeDevice",
+    )
+
+    def bindAliases(self, obj, names):
+        """
+        Binds CameraAssembler attributes to methods of the same names on 'obj'
 
-    def checkSensorVoltStat(self):
-        return self.sensor.checkSensorVoltStat()
-
-    def setTiming(self, side=None, sequence=None, delay=None):
-        return self.sensor.setTiming(side, sequence, delay)
-
-    def setArbTiming(self, side=None, sequence=None):
-        return self.sensor.setArbTiming(side, sequence)
-
-    def getTiming(self, side=None, actual=None):
-        return self.sensor.getTiming(side, actual)
-
-    def setManualShutters(self, timing=None):
-        return self.sensor.setManualShutters(timing)
-
-    def getManualTiming(self):
-        return self.sensor.getManualTiming()
-
-    def sensorSpecific(self):
-        return self.sensor.sensorSpecific()
-
-    def setInterlacing(self, ifactor=None):
-        return self.sensor.setInterlacing(ifactor)
-
-    def setHighFullWell(self, flag=True):
-        return self.sensor.setHighFullWell(flag)
-
-    def setZeroDeadTime(self, flag=True):
-        return self.sensor.setZeroDeadTime(flag)
-
-    def setTriggerDelay(self, delayblocks=0):
-        return self.sensor.setTriggerDelay(delayblocks)
-
-    def parseReadoff(self, frames):
-        return self.sensor.parseReadoff(frames)
-
-    def sendCMD(self, pkt):
-        return self.comms.sendCMD(pkt)
-
-    def arm(self, mode=None):
-        return self.comms.arm(mode)
-
-    def readoff(self, waitOnSRAM=None, timeout=0, fast=None):
-        return self.comms.readoff(waitOnSRAM, timeout, fast)
-
-    def writeSerial(self, cmd, timeout=None):
-        return self.comms.writeSerial(cmd, timeout)
-
-    def readSerial(self, size, timeout=None):
-        return self.comms.readSerial(size, timeout)
-
-    def closeDevice(self):
-        return self.comms.closeDevice()
-
-    ############## End aliases
+        Args:
+            obj: board, sensor, or comms object
+            names: names of methods to bind
+        """
+        for name in names:
+            setattr(self, name, getattr(obj, name))
 
     def initialize(self):
         """
@@ -439,59 +459,25 @@ class CameraAssembler:
         # For regular version
 
         # get sensor
-        if self.sensorname == "icarus":
-            import nsCamera.sensors.icarus as snsr
-        elif self.sensorname == "icarus2":
-            import nsCamera.sensors.icarus2 as snsr
-        elif self.sensorname == "daedalus":
-            import nsCamera.sensors.daedalus as snsr
-        else:  # catch-all for added sensors to attempt object encapsulation
-            sensormodname = ".sensors." + self.sensorname
-            try:
-                sensormod = importlib.import_module(sensormodname, "nsCamera")
-            except ImportError:
-                logging.critical(self.logcrit + "invalid sensor name")
-                sys.exit(1)
-            snsr = getattr(sensormod, self.sensorname)
-        self.sensor = snsr(self)
+        self.sensor = self.sensorcls(self)
+        self.bindAliases(self.sensor, self._SENSOR_ALIASES)
 
         # kill existing connections (for reinitialize)
         if hasattr(self, "comms"):
             self.closeDevice()
 
         # get communications interface
-        if self.commname == "rs422":
-            import nsCamera.comms.RS422 as comms
-        elif self.commname == "gige":
-            import nsCamera.comms.GigE as comms
-        else:
-            commsmodname = ".comms." + self.commname
-            try:
-                commsmod = importlib.import_module(commsmodname, "nsCamera")
-            except ImportError:
-                logging.critical(self.logcrit + "invalid comms name")
-                sys.exit(1)
-            comms = getattr(commsmod, self.commname)
-        self.comms = comms(self)
+        self.comms = self.commscls(self)
+        self.bindAliases(self.comms, self._COMMS_ALIASES)
 
         # get board
-        if self.boardname == "llnl_v1":
-            import nsCamera.boards.LLNL_v1 as brd
-
-            self.board = brd.llnl_v1(self)
-        elif self.boardname == "llnl_v4":
-            import nsCamera.boards.LLNL_v4 as brd
-
-            self.board = brd.llnl_v4(self)
-        else:
-            boardmodname = ".board." + self.boardname
-            try:
-                boardmod = importlib.import_module(boardmodname, "nsCamera")
-            except ImportError:
-                logging.critical(self.logcrit + "invalid board name")
-                sys.exit(1)
-            boardobj = getattr(boardmod, self.boardname)
-            self.board = boardobj(self)
+        self.subregcache = {}
+        self.msghandlers = {}
+        self.board = self.boardcls(self)
+        self.bindAliases(self.board, self._BOARD_ALIASES)
+        self.monitorpots = {
+            pot: mon for mon, pot in self.board.monitor_controls.items()
+        }
         ###############
 
         # ###############
@@ -529,14 +515,18 @@ class CameraAssembler:
         #     self.board = brd.llnl_v4(self)
         # ###############
 
-        err, rval = self.getRegister("FPGA_NUM")
-        if err or rval == "":
+        # retry with backoff to allow for link-up delay after the connection opens
+        for attempt in range(3):
+            if attempt:
+                time.sleep(0.2 * (1 << attempt))
             err, rval = self.getRegister("FPGA_NUM")
-            if err or rval == "":
-                logging.critical(
-                    self.logcrit + "Initialization failed: unable to communicate with "
-                    "board. "
-                )
+            if not err and rval:
+                break
+        else:
+            logging.critical(
+                self.logcrit + "Initialization failed: unable to communicate with "
+                "board. "
+            )
             sys.exit(1)
 
         self.initBoard()
@@ -546,6 +536,45 @@ class CameraAssembler:
         self.getBoardInfo()
         self.printBoardInfo()
 
+    def lookupName(self, name, registry, package):
+        """
+        Normalizes board, sensor, or comms name and finds the module and class that
+          implement it
+
+        Args:
+            name: name as given by the user
+            registry: one of the module-level name registries
+            package: nsCamera subpackage to search for names not in 'registry'
+
+        Returns:
+            tuple (canonical name, module name, class name)
+        """
+        name = str(name).lower()
+        if name in registry:
+            return registry[name]
+        # catch-all for added modules to attempt object encapsulation
+        return name, "nsCamera." + package + "." + name, name
+
+    def loadClass(self, modname, classname, kind):
+        """
+        Imports board, sensor, or comms module and returns its class; exits if the
+          module cannot be imported
+
+        Args:
+            modname: full name of module
+            classname: name of class in module
+            kind: 'board', 'sensor', or 'comms' (for logging)
+
+        Returns:
+            class object
+        """
+        try:
+            mod = importlib.import_module(modname)
+        except ImportError:
+            logging.critical(self.logcrit + "invalid " + kind + " name")
+            sys.exit(1)
+        return getattr(mod, classname)
+
     def reinitialize(self):
         """
         Reinitialize board registers and pots, reinitialize sensor timing (if
@@ -577,11 +606,13 @@ class CameraAssembler:
         """
         invalidFPGANum = False
         interfaces = []
+        fpganum = int(self.FPGANum, 16)
 
-        if int(self.FPGANum[0], 16) & 8:
-            if self.FPGANum[1] == "1":
+        if fpganum & 0x80000000:
+            boardnum = (fpganum >> 24) & 0xF
+            if boardnum == 1:
                 boardtype = "LLNLv1"
-            elif self.FPGANum[1] == "4":
+            elif boardnum == 4:
                 boardtype = "LLNLv4"
             else:
                 boardtype = "LLNLv?"
@@ -595,31 +626,29 @@ class CameraAssembler:
             invalidFPGANum = True
         self.FPGAboardtype = boardtype
 
-        if int(self.FPGANum[6], 16) & 1:
-            rad = True
-        else:
-            rad = False
+        rad = bool(fpganum & 0x10)
         self.FPGArad = rad
 
-        if self.FPGANum[7] == "1":
+        sensornum = fpganum & 0xF
+        if sensornum == 1:
             sensor = "Icarus"
-        elif self.FPGANum[7] == "2":
+        elif sensornum == 2:
             sensor = "Daedalus"
-        elif self.FPGANum[7] == "3":
+        elif sensornum == 3:
             sensor = "Horus"
         else:
             sensor = "Undefined"
             invalidFPGANum = True
         self.FPGAsensor = sensor
 
-        if int(self.FPGANum[5], 16) & 1:
+        if fpganum & 0x100:
             interfaces.append("RS422")
-        if int(self.FPGANum[5], 16) & 2:
+        if fpganum & 0x200:
             interfaces.append("GigE")
         self.FPGAinterfaces = interfaces
 
         if invalidFPGANum:
-            if self.FPGANum == "80000001":
+            if fpganum == 0x80000001:
                 invalidFPGANum = False
             else:
                 logging.warning(self.logwarn + "FPGA self-identification is invalid")
@@ -637,19 +666,86 @@ class CameraAssembler:
         Returns:
             tuple: (error string, register contents as hexadecimal string without '0x')
         """
-        regname = regname.upper()
+        if regname not in self.board.registers:  # names are usually upper case already
+            regname = regname.upper()
         if regname not in self.board.registers:
             err = (
                 self.logerr + "invalid register name: " + regname + " ; returning zeros"
             )
             logging.error(err)
             return err, "00000000"
-        sendpkt = Packet(cmd="1", addr=self.board.registers[regname])
+        if self.batchqueue:  # reads must reflect any queued writes
+            self.flushBatch()
+        sendpkt = self.readPacket(self.board.registers[regname])
         err, rval = self.comms.sendCMD(sendpkt)
         if err:
             logging.error(self.logerr + "getRegister " + regname + " " + err)
         return err, rval[8:16]
 
+    def readPacket(self, addr):
+        """
+        Returns read packet for register address; read packets never change, so each
+          is built (and its CRC calculated) only once
+
+        Args:
+            addr: register address as hexadecimal string without '0x'
+
+        Returns:
+            Packet object
+        """
+        pkt = self.readpkts.get(addr)
+        if pkt is None:
+            pkt = self.readpkts[addr] = Packet(cmd="1", addr=addr)
+        return pkt
+
+    def getRegisters(self, regnames):
+        """
+        Retrieves contents of several registers. If the comms interface supports it
+          (GigE), all read packets are sent in one write and all responses collected in
+          one read; otherwise the registers are read one at a time.
+
+        Args:
+            regnames: list of register names as given in ICD
+
+        Returns:
+            tuple: (accumulated error string, list of register contents as hexadecimal
+              strings without '0x'; invalid registers return zeros)
+        """
+        errs = ""
+        registers = self.board.registers
+        regnames = [
+            regname if regname in registers else regname.upper() for regname in regnames
+        ]
+        vals = ["00000000"] * len(regnames)
+        valid = []
+        for i, regname in enumerate(regnames):
+            if regname in self.board.registers:
+                valid.append(i)
+            else:
+                err = (
+                    self.logerr
+                    + "invalid register name: "
+                    + regname
+                    + " ; returning zeros"
+                )
+                logging.error(err)
+                errs = errs + err
+        if not hasattr(self.comms, "sendCMDs"):
+            for i in valid:
+                err, vals[i] = self.getRegister(regnames[i])
+                errs = errs + err
+            return errs, vals
+        if self.batchqueue:  # reads must reflect any queued writes
+            self.flushBatch()
+        pkts = [self.readPacket(self.board.registers[regnames[i]]) for i in valid]
+        err, rvals = self.comms.sendCMDs(pkts)
+        if err:
+            logging.error(self.logerr + "getRegisters " + err)
+            errs = errs + err
+        for i, rval in zip(valid, rvals):
+            vals[i] = rval[8:16]
+        return errs, vals
+
     def setRegister(self, regname, regval):
         """
         Sets named register to given value as hexadecimal string without '0x'
@@ -661,21 +757,72 @@ class CameraAssembler:
         Returns:
             tuple: (error string, response string)
         """
-        regname = regname.upper()
+        if regname not in self.board.registers:  # names are usually upper case already
+            regname = regname.upper()
         if regname not in self.board.registers:
             err = self.logerr + "Invalid register name: " + regname
             logging.error(err)
             return err, "00000000"
+        if self.batching:
+            self.batchqueue.append((regname, regval))
+            return "", ""
         pkt = Packet(addr=self.board.registers[regname], data=regval)
         err, rval = self.comms.sendCMD(pkt)
         if err:
             logging.error(self.logerr + "setRegister " + regname + ": " + err)
         return err, rval
 
+    def setRegisters(self, messages):
+        """
+        Sets several registers. If the comms interface supports it (GigE), all write
+          packets are sent in one write and all responses collected in one read;
+          otherwise the registers are set one at a time.
+
+        Args:
+            messages: list of tuples (register name, hexadecimal string without '0x')
+
+        Returns:
+            tuple: (accumulated error string, list of response strings)
+        """
+        if self.batching or not hasattr(self.comms, "sendCMDs"):
+            errs = ""
+            rvals = []
+            for regname, regval in messages:
+                err, rval = self.setRegister(regname, regval)
+                errs = errs + err
+                rvals.append(rval)
+            return errs, rvals
+        errs = ""
+        rvals = ["00000000"] * len(messages)
+        pkts = []
+        sent = []
+        for i, (regname, regval) in enumerate(messages):
+            if regname not in self.board.registers:
+                regname = regname.upper()
+            if regname not in self.board.registers:
+                err = self.logerr + "Invalid register name: " + regname
+                logging.error(err)
+                errs = errs + err
+            elif regname == "SRAM_CTL":  # readoff response cannot share an exchange
+                err, rvals[i] = self.setRegister(regname, regval)
+                errs = errs + err
+            else:
+                pkts.append(Packet(addr=self.board.registers[regname], data=regval))
+                sent.append(i)
+        if pkts:
+            err, resps = self.comms.sendCMDs(pkts)
+            if err:
+                logging.error(self.logerr + "setRegisters " + err)
+                errs = errs + err
+            for i, rval in zip(sent, resps):
+                rvals[i] = rval
+        return errs, rvals
+
     def resolveSubreg(self, srname):
         """
         Resolves subregister name or alias, returns object associated with subregister
-          and flag indicating writability
+          and flag indicating writability. Successful lookups are cached by the name
+          as given, until the board is reinitialized.
 
         Args:
             srname: name or alias of subregister
@@ -683,16 +830,17 @@ class CameraAssembler:
         Returns:
             tuple(subregister name string, associated object, writable flag)
         """
-        writable = False
-        srname = srname.upper()
-        if srname in self.board.subreg_aliases:
-            srname = self.board.subreg_aliases[srname].upper()
-        if srname in self.board.subreglist:
-            srobj = getattr(self.board, srname)
-            writable = getattr(self.board, srname).writable
-        else:
-            srobj = None
-        return srname, srobj, writable
+        resolved = self.subregcache.get(srname)
+        if resolved:
+            return resolved
+        name = srname.upper()
+        if name in self.board.subreg_aliases:
+            name = self.board.subreg_aliases[name].upper()
+        if name not in self.board.subregset:
+            return name, None, False
+        srobj = getattr(self.board, name)
+        resolved = self.subregcache[srname] = (name, srobj, srobj.writable)
+        return resolved
 
     def getSubregister(self, subregname):
         """
@@ -713,22 +861,105 @@ class CameraAssembler:
                 + ' , returning "0" string '
             )
             logging.error(err)
-            return err, "".zfill(8)
+            return err, "00000000"
+        err, value = self.readSubregister(subregobj)
+        if err:
+            return err, "00000000"
+        return "", subregobj.binfmt.format(value)
+
+    def getSubregisterInt(self, subregname):
+        """
+        Returns contents of subregister identified in board attribute 'subregname' as
+          an integer, without conversion to a binary string
+
+        Args:
+            subregname: listed in board.subreg_aliases or defined in board.subregisters
+
+        Returns:
+            tuple: (error string, contents of subregister as integer)
+        """
+        subregname, subregobj, _ = self.resolveSubreg(subregname)
+        if not subregobj:
+            err = (
+                self.logerr
+                + "getSubregisterInt: invalid lookup: "
+                + subregname
+                + " , returning 0 "
+            )
+            logging.error(err)
+            return err, 0
+        return self.readSubregister(subregobj)
+
+    def readSubregister(self, subregobj):
+        """
+        Returns contents of an already resolved subregister as an integer (see
+          resolveSubreg)
+
+        Args:
+            subregobj: subregister object
+
+        Returns:
+            tuple: (error string, contents of subregister as integer)
+        """
         err, resp = self.getRegister(subregobj.register)
         if err:
             logging.error(
                 self.logerr
-                + "getSubregister: unable to retrieve register setting: "
-                + subregname
-                + ' , returning "0" string'
+                + "readSubregister: unable to retrieve register setting: "
+                + subregobj.name
+                + " , returning 0"
             )
-            return err, "".zfill(8)
-        hex_str = "0x" + resp  # this should be a hexadecimalstring
-        b_reg_value = "{0:0=32b}".format(int(hex_str, 16))  # convert to binary string
-        # list indexing is reversed from bit string; the last bit of the string is at
-        #   index 0 in the list (thus bit 0 is at index 0)
-        startindex = 31 - subregobj.start_bit
-        return "", b_reg_value[startindex : startindex + subregobj.width]
+            return err, 0
+        return "", (int(resp, 16) >> subregobj.shift) & subregobj.max_value
+
+    def getSubregisters(self, subregnames):
+        """
+        Returns substrings of several registers. Each register containing one or more
+          of the subregisters is read only once, and all reads share a single exchange
+          where the comms interface supports it (see getRegisters).
+
+        Args:
+            subregnames: list of names listed in board.subreg_aliases or defined in
+              board.subregisters
+
+        Returns:
+            tuple: (accumulated error string, list of contents of subregisters as binary
+              strings without '0b'; invalid subregisters return zeros)
+        """
+        errs = ""
+        subregobjs = []
+        regnames = []
+        for subregname in subregnames:
+            subregname, subregobj, _ = self.resolveSubreg(subregname)
+            if not subregobj:
+                err = (
+                    self.logerr
+                    + "getSubregisters: invalid lookup: "
+                    + subregname
+                    + ' , returning "0" string '
+                )
+                logging.error(err)
+                errs = errs + err
+            elif subregobj.register not in regnames:
+                regnames.append(subregobj.register)
+            subregobjs.append(subregobj)
+        err, rvals = self.getRegisters(regnames)
+        if err:
+            logging.error(
+                self.logerr + "getSubregisters: unable to retrieve register settings"
+            )
+            errs = errs + err
+        regvals = dict(zip(regnames, rvals))
+        vals = []
+        for subregobj in subregobjs:
+            if not subregobj:
+                vals.append("00000000")
+                continue
+            value = (
+                int(regvals[subregobj.register], 16) >> subregobj.shift
+            ) & subregobj.max_value
+            vals.append(subregobj.binfmt.format(value))
+        return errs, vals
 
     def setSubregister(self, subregname, valstring):
         """
@@ -737,7 +968,7 @@ class CameraAssembler:
 
         Args:
             subregname: listed in board.subreg_aliases or defined in board.subregisters
-            valstring: binary string without '0b'
+            valstring: binary string without '0b', or integer
 
         Returns:
             tuple: (error, packet response string) from setRegister
@@ -755,36 +986,67 @@ class CameraAssembler:
             )
             logging.error(err)
             return err, "0"
-        if len(str(valstring)) > subregobj.width:
+        return self.writeSubregister(subregobj, valstring)
+
+    def writeSubregister(self, subregobj, valstring):
+        """
+        Sets an already resolved, writable subregister to valstring (see resolveSubreg
+          and setSubregister)
+
+        Args:
+            subregobj: subregister object
+            valstring: binary string without '0b', or integer
+
+        Returns:
+            tuple: (error, packet response string) from setRegister
+        """
+        if isinstance(valstring, int):
+            if not 0 <= valstring <= subregobj.max_value:
+                err = self.logerr + "setSubregister: replacement value is out of range"
+                logging.error(err)
+                return err, "0"
+        elif len(str(valstring)) > subregobj.width:
             err = self.logerr + "setSubregister: replacement string is too long"
             logging.error(err)
             return err, "0"
+        if self.batching:
+            self.batchqueue.append((subregobj.name, valstring))
+            return "", ""
         # read current value of register data
         err, resp = self.getRegister(subregobj.register)
         if err:
             logging.error(
                 self.logerr + "setSubregister: unable to retrieve register setting; "
-                "setting of " + subregname + " likely failed)"
+                "setting of " + subregobj.name + " likely failed)"
             )
             return err, "0"
-        hex_str = "0x" + resp
-        b_reg_value = "{0:0=32b}".format(int(hex_str, 16))  # convert to binary
-        # list indexing is reversed from bit string; the last bit of the string is at
-        #   index 0 in the list (thus bit 0 is at index 0)
-        startindex = 31 - subregobj.start_bit
-        valstringpadded = str(valstring).zfill(subregobj.width)
-        fullreg = list(b_reg_value)
-        fullreg[startindex : startindex + subregobj.width] = valstringpadded
-        # convert binary string back to hexadecimal string for writing
-        new_reg_value = "".join(fullreg)
-        h_reg_value = "{num:{fill}{width}x}".format(
-            num=int(new_reg_value, 2), fill="0", width=8
+        return self.setRegister(
+            subregobj.register, self.spliceSubregister(resp, subregobj, valstring)
         )
-        return self.setRegister(subregobj.register, h_reg_value)
+
+    def spliceSubregister(self, regval, subregobj, valstring):
+        """
+        Replaces the bits of register value 'regval' belonging to subregister object
+          'subregobj' with 'valstring'
+
+        Args:
+            regval: register contents as hexadecimal string without '0x'
+            subregobj: subregister object
+            valstring: binary string without '0b', or integer
+
+        Returns:
+            new register contents as hexadecimal string without '0x'
+        """
+        if not isinstance(valstring, int):
+            valstring = int(str(valstring), 2)
+        value = valstring << subregobj.shift
+        regint = (int(regval, 16) & ~subregobj.mask) | (value & subregobj.mask)
+        return "%08x" % regint
 
     def submitMessages(self, messages, errorstring="Error"):
         """
-        Serially set multiple register / subregister values
+        Set multiple register / subregister values; the writes are submitted together
+          (see flushBatch) unless called inside batch(), where they join the queue
 
         Args:
             messages: list of tuples (register name, hexadecimal string without '0x')
@@ -794,24 +1056,135 @@ class CameraAssembler:
         Returns:
             tuple (accumulated error string, response string of final message)
         """
-        errs = ""
-        err = ""
+        errs = []
         rval = ""
-        for m in messages:
-            if m[0].upper() in self.board.registers:
-                err, rval = self.setRegister(m[0].upper(), m[1])
-            elif m[0].upper() in self.board.subreglist:
-                err, rval = self.setSubregister(m[0].upper(), m[1])
+        # queue the messages and submit them together (see flushBatch)
+        nested = self.batching
+        self.batching = True
+        try:
+            for m in messages:
+                # setter for each name is found once and cached until the board is
+                #   rebuilt
+                handler = self.msghandlers.get(m[0])
+                if handler is None:
+                    name = m[0].upper()
+                    if name in self.board.registers:
+                        handler = self.msghandlers[m[0]] = (self.setRegister, name)
+                    elif name in self.board.subregset:
+                        handler = self.msghandlers[m[0]] = (self.setSubregister, name)
+                if handler:
+                    err, rval = handler[0](handler[1], m[1])
+                else:
+                    err = (
+                        self.logerr
+                        + "submitMessages: Invalid register/subregister: "
+                        + errorstring
+                        + m[0]
+                    )
+                    logging.error(err)
+                if err:
+                    errs.append(err)
+        except Exception:
+            if not nested:
+                self.batchqueue = []  # don't send part of a failed set with later writes
+            raise
+        finally:
+            self.batching = nested
+        if not nested:
+            err, rval = self.flushBatch()
+            if err:
+                errs.append(err)
+        return "".join(errs), rval
+
+    @contextlib.contextmanager
+    def batch(self):
+        """
+        Context manager that queues register and subregister writes (including those
+          made by setPot and setPotV) and submits them together when the block exits.
+          Subregister writes to the same register share a single read of that
+          register. Any register read inside the block first submits the queued
+          writes, so reads always reflect earlier writes. setPotV with tune=True is
+          not batched, since each pot change must be written before the monitor
+          reading that follows it.
+
+        Example:
+            with ca.batch():
+                ca.setPot("HST_B_NDELAY", 1)
+                ca.setRegister("LED_GP", "000000FF")
+                ca.setSubregister("COLQUENCHEN", "0")
+        """
+        nested = self.batching
+        self.batching = True
+        try:
+            yield self
+        finally:
+            if not nested:
+                self.batching = False
+                self.flushBatch()
+
+    def flushBatch(self):
+        """
+        Submit register and subregister writes queued by batch(), in order. Registers
+          holding queued subregister writes that are not first written whole in the
+          batch are read together before the writes; all writes are then sent together
+          (see getRegisters and setRegisters)
+
+        Returns:
+            tuple (accumulated error string, response string of final write)
+        """
+        queue = self.batchqueue
+        self.batchqueue = []
+        batching = self.batching
+        self.batching = False
+        errs = ""
+        # registers whose contents must be read to splice in subregister values
+        written = set()
+        toread = []
+        for name, value in queue:
+            if name in self.board.registers:
+                written.add(name)
             else:
-                err = (
-                    self.logerr
-                    + "submitMessages: Invalid register/subregister: "
-                    + errorstring
-                    + m[0]
+                regname = getattr(self.board, name).register
+                if regname not in written and regname not in toread:
+                    toread.append(regname)
+        regvals = {}  # register contents as known during this flush
+        if toread:
+            err, rvals = self.getRegisters(toread)
+            if err:
+                logging.error(
+                    self.logerr + "flushBatch: unable to retrieve register settings; "
+                    "queued subregister settings likely failed"
                 )
-                logging.error(err)
+                errs = errs + err
+            else:
+                regvals = dict(zip(toread, rvals))
+        writes = []
+        for name, value in queue:
+            if name in self.board.registers:
+                regvals[name] = value
+                writes.append((name, value))
+            else:
+                subregobj = getattr(self.board, name)
+                regname = subregobj.register
+                if regname not in regvals:
+                    err = (
+                        self.logerr + "flushBatch: unable to retrieve register "
+                        "setting; setting of " + name + " likely failed"
+                    )
+                    logging.error(err)
+                    errs = errs + err
+                    continue
+                regvals[regname] = self.spliceSubregister(
+                    regvals[regname], subregobj, value
+                )
+                writes.append((regname, regvals[regname]))
+        rval = ""
+        if writes:
+            err, rvals = self.setRegisters(writes)
             errs = errs + err
-        return err, rval
+            rval = rvals[-1]
+        self.batching = batching
+        return errs, rval
 
     def getPot(self, potname, errflag=False):
         """
@@ -837,14 +1210,12 @@ class CameraAssembler:
             if errflag:
                 return err, "0"
             return "0"
-        err, b_pot_value = self.getSubregister(potname)
+        err, reg_value = self.readSubregister(potobj)
         if err:
             logging.warning(
                 self.logerr + "getPot: unable to read subregister " + potname
             )
-        # convert binary string back to decimal
-        f_reg_value = 1.0 * int(b_pot_value, 2)
-        value = (f_reg_value - potobj.min) / (potobj.max - potobj.min)
+        value = (1.0 * reg_value - potobj.min) / (potobj.max - potobj.min)
         if errflag:
             return err, value
         return value
@@ -866,10 +1237,7 @@ class CameraAssembler:
             else:
                 response packet as string
         """
-        if value < 0:
-            value = 0.0
-        if value > 1:
-            value = 1.0
+        value = 0.0 if value < 0 else 1.0 if value > 1 else value
 
         potname, potobj, writable = self.resolveSubreg(potname)
         if not potobj:
@@ -887,36 +1255,77 @@ class CameraAssembler:
                 return err, "0"
             return 0
         setpoint = int(round(value * potobj.max_value))
-        setpointpadded = "{num:{fill}{width}b}".format(
-            num=setpoint, fill="0", width=potobj.width
-        )
-        err, rval = self.setSubregister(potname, setpointpadded)
+        err, rval = self.writePot(potobj, setpoint, self.potLatch(potname))
+        if errflag:
+            return err, rval
+        return rval
+
+    def writePot(self, potobj, setpoint, latch):
+        """
+        Writes setting of an already resolved pot and latches it. Outside of batch(),
+          the pot's register is read and then the new setting and the latch are
+          written in a single exchange where the comms interface supports it (see
+          setRegisters)
+
+        Args:
+            potobj: pot subregister object
+            setpoint: integer pot setting
+            latch: tuple (control register name, latch value) from potLatch
+
+        Returns:
+            tuple: (error string, response packet of pot register write as string)
+        """
+        err1 = ""
+        if self.batching:
+            err, rval = self.writeSubregister(potobj, setpoint)
+            err1, _ = self.setRegister(*latch)
+        else:
+            rval = "0"
+            err, resp = self.getRegister(potobj.register)
+            if not err:
+                err1, rvals = self.setRegisters(
+                    [
+                        (
+                            potobj.register,
+                            self.spliceSubregister(resp, potobj, setpoint),
+                        ),
+                        latch,
+                    ]
+                )
+                rval = rvals[0]
         if err:
             logging.error(
                 self.logerr
                 + "setPot: unable to confirm setting of subregister: "
-                + potname
+                + potobj.name
             )
+        if err1:
+            logging.error(self.logerr + "setPot: unable to set or latch register")
+        return err + err1, rval
+
+    def potLatch(self, potname):
+        """
+        Returns control register and value that latch the setting of pot 'potname'
+
+        Args:
+            potname: resolved pot subregister name, e.g., POT8 or DACA
+
+        Returns:
+            tuple (control register name, latch value as hexadecimal string without
+              '0x')
+        """
+        latch = self.potlatches.get(potname)
+        if latch:
+            return latch
         ident = potname[3:]
         if ident[0].isdigit():  # numbered pot scheme
-            potnumlatch = int(ident) * 2 + 1
-            potnumlatchstring = "{num:{fill}{width}x}".format(
-                num=potnumlatch, fill="0", width=8
-            )
-            err1, resp = self.setRegister("POT_CTL", potnumlatchstring)
+            latch = "POT_CTL", "%08x" % (int(ident) * 2 + 1)
         else:  # alphabetical DAC scheme
-            ident = ident.upper()  # expects single character, e.g. 'A' from 'DACA'
-            identnum = ord(ident) - ord("A")  # DACA -> 0
-            potnumlatch = int(identnum) * 2 + 1
-            potnumlatchstring = "{num:{fill}{width}x}".format(
-                num=potnumlatch, fill="0", width=8
-            )
-            err1, resp = self.setRegister("DAC_CTL", potnumlatchstring)
-        if err1:
-            logging.error(self.logerr + "setPot: unable to latch register")
-        if errflag:
-            return err + err1, rval
-        return rval
+            # expects single character, e.g. 'A' from 'DACA'; DACA -> 0
+            identnum = ord(ident.upper()) - ord("A")
+            latch = "DAC_CTL", "%08x" % (identnum * 2 + 1)
+        self.potlatches[potname] = latch
+        return latch
 
     def getPotV(self, potname, errflag=False):
         """
@@ -945,9 +1354,10 @@ class CameraAssembler:
             if errflag:
                 return err, "0"
             return "0"
-        err, val = self.getPot(potname, errflag=True)
+        err, regval = self.readSubregister(potobj)
         if err:
             logging.error(self.logerr + "getPotV: unable to read pot " + potname)
+        val = (1.0 * regval - potobj.min) / (potobj.max - potobj.min)
         minV = potobj.minV
         maxV = potobj.maxV
         if errflag:
@@ -962,6 +1372,9 @@ class CameraAssembler:
         accuracy=0.01,
         iterations=20,
         approach=0.75,
+        samples=1,
+        recalibrate=True,
+        settle=0.2,
         errflag=False,
     ):
         """
@@ -979,7 +1392,16 @@ class CameraAssembler:
               possible pot setting and warns if last iteration does not reduce error
               below the resolution of the pot)
             iterations: number of iteration attempts
-            approach: approximation parameter (>1 may cause overshoot)
+            approach: approximation parameter (>1 may cause overshoot); damps tuning
+              steps until the monitor response slope has been measured by secant
+            samples: number of monitor readings averaged for each tuning measurement
+              (see getMonV)
+            recalibrate: if False, start tuning from the calibration left by the last
+              tuning of this pot (if any) instead of measuring the monitor response
+              again
+            settle: seconds to wait after each pot change before reading the monitor
+              (the board has no settled flag to poll); may be reduced for fast analog
+              paths
             errflag: if True, return tuple with error string
 
         Returns:
@@ -988,6 +1410,27 @@ class CameraAssembler:
             else:
                 response string
         """
+        if tune and self.batching:
+            # each pot change must reach the board before the settle delay and the
+            #   monitor reading that follow it, so tuning is not batched; writes
+            #   queued earlier are submitted first to keep them in order
+            self.flushBatch()
+            self.batching = False
+            try:
+                return self.setPotV(
+                    potname,
+                    voltage,
+                    tune,
+                    accuracy,
+                    iterations,
+                    approach,
+                    samples,
+                    recalibrate,
+                    settle,
+                    errflag,
+                )
+            finally:
+                self.batching = True
         potname, potobj, writable = self.resolveSubreg(potname)
         if not potobj:
             err = (
@@ -1006,15 +1449,12 @@ class CameraAssembler:
             if errflag:
                 return err, "0"
             return "0"
-        if voltage < potobj.minV:
-            voltage = potobj.minV
-        if voltage > potobj.maxV:
-            voltage = potobj.maxV
+        voltage = min(max(voltage, potobj.minV), potobj.maxV)
         setting = (voltage - potobj.minV) / (potobj.maxV - potobj.minV)
         err, rval = self.setPot(potname, setting, errflag=True)
-        time.sleep(0.1)
+        time.sleep(settle / 2)
         if tune:
-            if potname not in self.board.monitor_controls.values():
+            if potname not in self.monitorpots:
                 err = (
                     self.logerr
                     + "setPotV: pot '"
@@ -1025,14 +1465,19 @@ class CameraAssembler:
                 if errflag:
                     return err, rval
                 return rval
-            self.setPot(potname, 0.65)
-            time.sleep(0.2)
-            err1, mon65 = self.getMonV(potname, errflag=True)
-            self.setPot(potname, 0.35)
-            time.sleep(0.2)
-            err2, mon35 = self.getMonV(potname, errflag=True)
-            # theoretical voltage range assuming linearity
-            potrange = (mon65 - mon35) / 0.3
+            err1 = err2 = ""
+            if recalibrate or potname not in self.potcals:
+                self.setPot(potname, 0.65)
+                time.sleep(settle)
+                err1, mon65 = self.getMonV(potname, errflag=True, samples=samples)
+                self.setPot(potname, 0.35)
+                time.sleep(settle)
+                err2, mon35 = self.getMonV(potname, errflag=True, samples=samples)
+                # theoretical voltage range assuming linearity
+                potrange = (mon65 - mon35) / 0.3
+                # (range, reference setting, monitor voltage at reference, slope)
+                self.potcals[potname] = (potrange, 0.35, mon35, potrange)
+            potrange, refsetting, refmeasured, slope = self.potcals[potname]
             stepsize = potrange / (potobj.max_value + 1)
             err += err1 + err2
             if err or potrange < 1:
@@ -1043,28 +1488,30 @@ class CameraAssembler:
                 if errflag:
                     return err, rval
                 return rval
-            potzero = 0.35 - (mon35 / potrange)
-            potone = 1.65 - (mon65 / potrange)
-            if potzero < 0:
-                potzero = 0
-            if potone > 1:
-                potone = 1
-
             if accuracy > stepsize:
                 mindiff = accuracy
             else:
                 mindiff = stepsize
-            setting = potzero + (voltage / potone)
+            # invert the linear calibration to get the first setting directly
+            setting = refsetting + (voltage - refmeasured) / slope
+            setting = 1 if setting > 1 else 0 if setting < 0 else setting
             self.setPot(potname, setting)
+            # slope is volts per unit setting; refined by secant from successive
+            #   measurements
+            lastsetting = None
+            lastmeasured = 0
+            secantsteps = 0
             lastdiff = 0
             smalladjust = 0
             err3 = ""
+            halfstep = stepsize / 2  # loop invariants
+            minstep = 1.0 / potobj.max_value
             for _ in range(iterations):
-                err3i, measured = self.getMonV(potname, errflag=True)
+                err3i, measured = self.getMonV(potname, errflag=True, samples=samples)
                 if err3i:
                     err3 = err3 + err3i + " "
                 diff = voltage - measured
-                if abs(diff - lastdiff) < stepsize / 2:
+                if abs(diff - lastdiff) < halfstep:
                     if (
                         smalladjust > 12
                     ):  # magic number for now; if it doesn't converge after several
@@ -1088,16 +1535,28 @@ class CameraAssembler:
                     if errflag:
                         return "", rval
                     return rval
-                adjust = approach * (diff / potrange)
+                if (
+                    lastsetting is not None
+                    and abs(setting - lastsetting) > minstep
+                ):
+                    secant = (measured - lastmeasured) / (setting - lastsetting)
+                    # ignore estimates dominated by monitor noise
+                    if secant > potrange / 4:
+                        slope = secant
+                        secantsteps += 1
+                lastsetting = setting
+                lastmeasured = measured
+                self.potcals[potname] = (potrange, setting, measured, slope)
+                if secantsteps:  # measured slope; take full secant step
+                    adjust = diff / slope
+                else:
+                    adjust = approach * (diff / slope)
                 setting += adjust
-                if setting > 1:
-                    setting = 1
-                elif setting < 0:
-                    setting = 0
+                setting = 1 if setting > 1 else 0 if setting < 0 else setting
                 err1, rval = self.setPot(potname, setting, True)
                 lastdiff = diff
-                time.sleep(0.2)
-            err4, measured = self.getMonV(potname, errflag=True)
+                time.sleep(settle)
+            err4, measured = self.getMonV(potname, errflag=True, samples=samples)
             diff = voltage - measured
             # code will try to get to within one stepsize, but will only complain if it
             #   doesn't get within mindiff
@@ -1119,7 +1578,65 @@ class CameraAssembler:
             return err, rval
         return rval
 
-    def getMonV(self, monname, errflag=False):
+    def sweepPotV(
+        self, potname, voltages, tune=True, samples=1, monname=None, **kwargs
+    ):
+        """
+        Sets pot to each of a list of voltages in turn and reads the associated monitor
+          at each. Voltages are visited in ascending order; when tuning, the monitor
+          response is calibrated once and each tuning starts from the setting and slope
+          found by the previous one, so later steps usually need only one or two
+          adjustments.
+
+        Args:
+            potname: common name of pot, e.g., VRST found in board.subreg_aliases or
+              defined in board.subregisters
+            voltages: list or array of voltages
+            tune: if True, tune each voltage using monitor (see setPotV)
+            samples: number of monitor readings averaged for each measurement
+            monname: monitor to read, defaults to monitor associated with 'potname'
+            **kwargs: additional tuning parameters (accuracy, iterations, approach)
+              passed to setPotV
+
+        Returns:
+            numpy array of monitor voltages, in the same order as 'voltages'
+        """
+        if monname is None:
+            monname = potname
+        voltages = np.asarray(voltages, dtype=float)
+        actuals = np.zeros(len(voltages))
+        recalibrate = True
+        for i in np.argsort(voltages):
+            self.setPotV(
+                potname,
+                voltages[i],
+                tune=tune,
+                samples=samples,
+                recalibrate=recalibrate,
+                **kwargs
+            )
+            recalibrate = False
+            actuals[i] = self.getMonV(monname, samples=samples)
+        return actuals
+
+    def resolveMonitor(self, monname):
+        """
+        Resolves alias, then replaces pot name with name of its associated monitor
+
+        Args:
+            monname: name of pot or monitor, e.g., VRST or MON_CH2 found in
+              board.subreg_aliases or defined in board.subregisters
+
+        Returns:
+            monitor (or other subregister) name string
+        """
+        if not monname.isupper():  # names from internal callers are already upper case
+            monname = monname.upper()
+        if monname in self.board.subreg_aliases:
+            monname = self.board.subreg_aliases[monname].upper()
+        return self.monitorpots.get(monname, monname)
+
+    def getMonV(self, monname, errflag=False, samples=1):
         """
         Reads voltage from monitor named or that associated with the pot named 'monname'
 
@@ -1127,6 +1644,8 @@ class CameraAssembler:
             monname: name of pot or monitor, e.g., VRST or MON_CH2 found in
               board.subreg_aliases or defined in board.subregisters
             errflag: if True, return tuple with error string
+            samples: number of readings to average; successive readings are one ADC
+              polling period apart (see averageMonitor)
 
         Returns:
             if errflag:
@@ -1134,15 +1653,9 @@ class CameraAssembler:
             else:
                 float value of voltage measured by monitor
         """
-        monname = monname.upper()
-        if monname in self.board.subreg_aliases:
-            monname = self.board.subreg_aliases[monname].upper()
-        # else:
-        for key, value in self.board.monitor_controls.items():
-            if value == monname:
-                monname = key
+        monname = self.resolveMonitor(monname)
         if monname not in self.board.monitor_controls:
-            if monname in self.board.subreglist:
+            if monname in self.board.subregset:
                 pass  # no change necessary
             else:
                 err = (
@@ -1152,21 +1665,88 @@ class CameraAssembler:
                 if errflag:
                     return err, 0
                 return 0
-        err, monval = self.getPot(monname, errflag=True)
+        if samples > 1:
+            err, monval = self.averageMonitor(monname, samples)
+        else:
+            err, monval = self.getPot(monname, errflag=True)
         if err:
             logging.error(
                 self.logerr + "getMonV: unable to read monitor value for " + monname
             )
+        if errflag:
+            return err, self.monToV(monval)
+        return self.monToV(monval)
+
+    def averageMonitor(self, monname, samples):
+        """
+        Reads monitor subregister 'samples' times and averages the readings. The board
+          updates the monitor registers once per ADC polling period (see setPPER), so
+          repeated reads within one period return the same conversion; the readings
+          are therefore spaced one polling period apart.
+
+        Args:
+            monname: resolved name of monitor subregister
+            samples: number of readings
+
+        Returns:
+            tuple: (error string, mean monitor value, scaled to [0,1) )
+        """
+        _, monobj, _ = self.resolveSubreg(monname)
+        err, pper = self.getSubregisterInt("PPER")
+        period = (pper if pper else 50) / 1000.0  # milliseconds; 50 is the default
+        raw = np.zeros(samples, dtype=np.int64)
+        for i in range(samples):
+            if i:
+                time.sleep(period)
+            err1, rval = self.getRegister(monobj.register)
+            err = err + err1
+            raw[i] = int(rval, 16)
+        monvals = ((raw >> monobj.shift) & monobj.max_value) - monobj.min
+        monvals = monvals / (1.0 * monobj.max - monobj.min)
+        if self.board.ADC5_bipolar:
+            # unwrap negative readings before averaging (two's complement)
+            monvals[monvals >= 0.5] -= 1
+        return err, float(monvals.mean())
+
+    def monToV(self, monval):
+        """
+        Converts ADC monitor reading to voltage
+
+        Args:
+            monval: monitor subregister value, scaled to [0,1)
+
+        Returns:
+            float value of voltage measured by monitor
+        """
         if self.board.ADC5_bipolar:
             if monval >= 0.5:
                 monval -= 1  # handle negative measurements (two's complement)
-            if errflag:
-                return err, 2 * self.board.ADC5_mult * monval * self.board.VREF
             return 2 * self.board.ADC5_mult * monval * self.board.VREF
-        else:
-            if errflag:
-                return err, self.board.ADC5_mult * monval * self.board.VREF
-            return self.board.ADC5_mult * monval * self.board.VREF
+        return self.board.ADC5_mult * monval * self.board.VREF
+
+    def channel(self, name):
+        """
+        Returns a Channel handle for pot or monitor 'name'. The name is resolved once;
+          the handle's get/set/getV/setV/monV methods then use the resolved subregister
+          name directly. Handles are cached, so repeated calls return the same object.
+
+        Args:
+            name: name of pot or monitor, e.g., VRST or MON_CH2 found in
+              board.subreg_aliases or defined in board.subregisters
+
+        Returns:
+            Channel object, or None if 'name' is not a valid subregister
+        """
+        if name in self.channels:
+            return self.channels[name]
+        srname, srobj, writable = self.resolveSubreg(name)
+        if not srobj:
+            logging.error(self.logerr + "channel: invalid lookup: " + srname)
+            return None
+        if srname not in self.channels:
+            self.channels[srname] = Channel(self, srname, srobj, writable)
+        self.channels[name] = self.channels[srname]
+        return self.channels[name]
 
     def readImgs(self, waitOnSRAM=True, mode="Hardware"):
         """
@@ -1210,13 +1790,37 @@ class CameraAssembler:
             )
         delaced = []
         for frame in frames:
-            for sub in range(ifactor + 1):
-                current = np.zeros((newheight, self.sensor.width), dtype=int)
-                for line in range(newheight):
-                    current[line] = frame[(ifactor + 1) * line + sub]
-                delaced.append(current)
+            # view the rows as (line, sub, column); moving 'sub' to the front and
+            #   copying once gives each subframe as a contiguous block
+            lines = np.asarray(frame)[: (ifactor + 1) * newheight]
+            lines = lines.reshape(newheight, ifactor + 1, self.sensor.width)
+            delaced.extend(np.ascontiguousarray(lines.transpose(1, 0, 2), dtype=int))
         return delaced
 
+    def makePath(self, path):
+        """
+        Creates directory 'path' (and any parents) if it does not exist. Directories
+          are remembered once created or found, so repeated saves to the same directory
+          do not check the filesystem again
+
+        Args:
+            path: directory path
+        """
+        if path not in self.savepaths:
+            os.makedirs(path, exist_ok=True)
+            self.savepaths.add(path)
+
+    def timePrefix(self):
+        """
+        Returns default filename prefix for save functions, from the current date and
+          time to tenths of a second. To give the files of several saves one prefix,
+          call this once and pass the result as 'prefix'
+
+        Returns:
+            prefix string, e.g. '160830-124704_'
+        """
+        return datetime.now().strftime("%y%m%d-%H%M%S%f")[:-5] + "_"
+
     def saveFrames(
         self, frames, path=None, filename="frames", prefix=None,
     ):
@@ -1238,47 +1842,57 @@ class CameraAssembler:
         if path is None:
             path = os.path.join(os.getcwd(), "output")
         if prefix is None:
-            prefix = datetime.now().strftime("%y%m%d-%H%M%S%f")[:-5] + "_"
-        if not os.path.exists(path):
-            os.makedirs(path)
+            prefix = self.timePrefix()
+        self.makePath(path)
 
         if isinstance(frames[0], str):
             filename = filename + ".txt"
-            savefile = open(os.path.join(path, prefix + filename), "w+")
-            savefile.write(frames)
+            with open(os.path.join(path, prefix + filename), "w+") as savefile:
+                savefile.write(frames)
 
         else:
             filename = filename + ".bin"
-            stacked = np.stack(frames)
-            try:
-                stacked = stacked.reshape(
-                    (
-                        self.sensor.nframes,
-                        self.sensor.height // (self.sensor.interlacing + 1),
-                        self.sensor.width,
-                    )
+            expected = (
+                self.sensor.nframes
+                * (self.sensor.height // (self.sensor.interlacing + 1))
+                * self.sensor.width
+            )
+            if sum(np.size(frame) for frame in frames) != expected:
+                err = (
+                    self.logerr + "saveFrames: frame data does not match sensor "
+                    "dimensions"
                 )
-            except Exception as e:
-                err = self.logerr + "saveFrames: unable to save frames: " + str(e)
                 logging.error(err)
-
-            stacked.tofile(os.path.join(path, prefix + filename))
+            # write frames one after another instead of first stacking them into a
+            #   new array; the file contents are the same
+            with open(os.path.join(path, prefix + filename), "wb") as savefile:
+                for frame in frames:
+                    np.asarray(frame).tofile(savefile)
         return err
 
     def saveTiffs(
-        self, frames, path=None, filename="Frame", prefix=None, index=None,
+        self,
+        frames,
+        path=None,
+        filename="Frame",
+        prefix=None,
+        index=None,
+        perframe=True,
     ):
         """
         Save numpy array or list of numpy arrays or single array to disk as individual
           tiffs, with frame number appended to filename.
 
         Args:
-            frames: numpy array or list of numpy arrays
+            frames: numpy array or list of numpy arrays (or 3D array of
+              frames, e.g., from saveRaw)
             path: save path, defaults to './output'
             filename: defaults to 'Frame' followed by frame number
             prefix: prepended to 'filename', defaults to time/date
               (e.g. '160830-124704_')
             index: number to start frame numbering
+            perframe: if False, save all frames as pages of a single multi-page tiff
+              named 'filename' instead of one file per frame
 
         Returns:
             Error string
@@ -1288,34 +1902,40 @@ class CameraAssembler:
         if path is None:
             path = os.path.join(os.getcwd(), "output")
         if prefix is None:
-            prefix = datetime.now().strftime("%y%m%d-%H%M%S%f")[:-5] + "_"
-        if not os.path.exists(path):
-            os.makedirs(path)
+            prefix = self.timePrefix()
+        self.makePath(path)
         if index is None:
             nframe = self.sensor.firstframe
         else:
             nframe = index
 
+        if isinstance(frames, np.ndarray) and frames.ndim == 3:
+            frames = list(frames)  # e.g., memory map from saveRaw; list of views
         if type(frames) is not list:
             frames = [frames]
         # if this is a text string from fast readoff, do the numpy conversion now
         if isinstance(frames[0], str):
             frames = self.generateFrames(frames)
 
-        framestemp = np.copy(frames)
-        for frame in framestemp:
+        if self.padToFull:
+            shape = (
+                self.sensor.maxheight // (self.sensor.interlacing + 1),
+                self.sensor.maxwidth,
+            )
+        else:
+            shape = (
+                self.sensor.height // (self.sensor.interlacing + 1),
+                self.sensor.width,
+            )
+        pages = []
+        for frame in frames:
             try:
-                if self.padToFull:
-                    frame.shape = (
-                        self.sensor.maxheight // (self.sensor.interlacing + 1),
-                        self.sensor.maxwidth,
-                    )
-                else:
-                    frame.shape = (
-                        self.sensor.height // (self.sensor.interlacing + 1),
-                        self.sensor.width,
-                    )
-                frameimg = Image.fromarray(frame)
+                # reshape gives a view of each frame (no copy of the whole set); PIL
+                #   encodes directly from it, or from a memory map passed in
+                frameimg = Image.fromarray(np.reshape(frame, shape))
+                if not perframe:
+                    pages.append(frameimg)
+                    continue
                 namenum = filename + "_%d" % nframe
                 tifpath = os.path.join(path, prefix + namenum + ".tif")
                 frameimg.save(tifpath)
@@ -1324,22 +1944,38 @@ class CameraAssembler:
                 err = self.logerr + "saveTiffs: unable to save images"
                 logging.error(err)
                 continue
+        if pages:
+            try:
+                tifpath = os.path.join(path, prefix + filename + ".tif")
+                pages[0].save(tifpath, save_all=True, append_images=pages[1:])
+            except:
+                err = self.logerr + "saveTiffs: unable to save multi-page tiff"
+                logging.error(err)
         return err
 
     def saveNumpys(
-        self, frames, path=None, filename="Frame", prefix=None, index=None,
+        self,
+        frames,
+        path=None,
+        filename="Frame",
+        prefix=None,
+        index=None,
+        perframe=True,
     ):
         """
         Save numpy array or list of numpy arrays to disk as individual numpy data files,
           with frame number appended to filename.
 
         Args:
-            frames: numpy array or list of numpy arrays or single numpy array
+            frames: numpy array or list of numpy arrays or single numpy array (or 3D
+              array of frames, e.g., from saveRaw)
             path: save path, defaults to './output'
             filename: defaults to 'Frame' followed by frame number
             prefix: prepended to 'filename', defaults to time/date
               (e.g. '160830-124704_')
             index: number to start frame numbering
+            perframe: if False, save all frames as a single 3D array (frame, row,
+              column) in one numpy file named 'filename'
 
         Returns:
             Error string
@@ -1349,13 +1985,14 @@ class CameraAssembler:
         if path is None:
             path = os.path.join(os.getcwd(), "output")
         if prefix is None:
-            prefix = datetime.now().strftime("%y%m%d-%H%M%S%f")[:-5] + "_"
-        if not os.path.exists(path):
-            os.makedirs(path)
+            prefix = self.timePrefix()
+        self.makePath(path)
         if index is None:
             nframe = self.sensor.firstframe
         else:
             nframe = index
+        if isinstance(frames, np.ndarray) and frames.ndim == 3:
+            frames = list(frames)  # e.g., memory map from saveRaw; list of views
         if type(frames) is not list:
             frames = [frames]
 
@@ -1363,22 +2000,46 @@ class CameraAssembler:
         if isinstance(frames[0], str):
             frames = self.generateFrames(frames)
 
-        framestemp = np.copy(frames)
-        for frame in framestemp:
+        if self.padToFull:
+            shape = (
+                self.sensor.maxheight // (self.sensor.interlacing + 1),
+                self.sensor.maxwidth,
+            )
+        else:
+            shape = (
+                self.sensor.height // (self.sensor.interlacing + 1),
+                self.sensor.width,
+            )
+        if not perframe:
+            try:
+                # copy each frame once into the preallocated 3D array
+                stack = np.empty(
+                    (len(frames),) + shape, dtype=np.asarray(frames[0]).dtype
+                )
+                for n, frame in enumerate(frames):
+                    stack[n] = np.reshape(frame, shape)
+                nppath = os.path.join(path, prefix + filename + ".npy")
+                np.save(nppath, stack)
+            except:
+                err = self.logerr + "saveNumpys: unable to save arrays"
+                logging.error(err)
+            return err
+
+        # frames share shape and dtype, so the .npy header is encoded once; each file
+        #   is then the header followed by the raw frame data
+        headers = {}
+        for frame in frames:
             try:
-                if self.padToFull:
-                    frame.shape = (
-                        self.sensor.maxheight // (self.sensor.interlacing + 1),
-                        self.sensor.maxwidth,
-                    )
-                else:
-                    frame.shape = (
-                        self.sensor.height // (self.sensor.interlacing + 1),
-                        self.sensor.width,
-                    )
                 namenum = filename + "_%d" % nframe
                 nppath = os.path.join(path, prefix + namenum + ".npy")
-                np.save(nppath, frame)
+                # reshape gives a view; the caller's frames are not copied or modified
+                frame = np.reshape(frame, shape)
+                header = headers.get(frame.dtype)
+                if header is None:
+                    header = headers[frame.dtype] = self.npyHeader(frame.dtype, shape)
+                with open(nppath, "wb") as npfile:
+                    npfile.write(header)
+                    frame.tofile(npfile)
                 nframe += 1
             except:
                 err = self.logerr + "saveNumpys: unable to save arrays"
@@ -1386,6 +2047,88 @@ class CameraAssembler:
                 continue
         return err
 
+    def npyHeader(self, dtype, shape):
+        """
+        Returns header of a numpy (.npy) file holding a C-ordered array
+
+        Args:
+            dtype: numpy dtype of array
+            shape: shape of array
+
+        Returns:
+            header as bytes
+        """
+        header = io.BytesIO()
+        np.lib.format.write_array_header_1_0(
+            header,
+            {
+                "descr": np.lib.format.dtype_to_descr(dtype),
+                "fortran_order": False,
+                "shape": shape,
+            },
+        )
+        return header.getvalue()
+
+    def saveRaw(
+        self, frames, path=None, filename="Frames", prefix=None,
+    ):
+        """
+        Save list of frames as a single (frame, row, column) numpy file, written through
+          a memory map. The returned memory-mapped array can be passed to saveTiffs,
+          saveNumpys, or plotFrames, and the file can be reopened later without loading
+          it into memory using np.load(file, mmap_mode="r").
+
+        Args:
+            frames: numpy array or list of numpy arrays
+            path: save path, defaults to './output'
+            filename: defaults to 'Frames'
+            prefix: prepended to 'filename', defaults to time/date
+              (e.g. '160830-124704_')
+
+        Returns:
+            tuple (error string, memory-mapped array or None if save failed)
+        """
+        logging.info(self.loginfo + "saveRaw")
+        err = ""
+        if path is None:
+            path = os.path.join(os.getcwd(), "output")
+        if prefix is None:
+            prefix = self.timePrefix()
+        self.makePath(path)
+        if type(frames) is not list:
+            frames = [frames]
+
+        # if this is a text string from fast readoff, do the numpy conversion now
+        if isinstance(frames[0], str):
+            frames = self.generateFrames(frames)
+
+        if self.padToFull:
+            shape = (
+                self.sensor.maxheight // (self.sensor.interlacing + 1),
+                self.sensor.maxwidth,
+            )
+        else:
+            shape = (
+                self.sensor.height // (self.sensor.interlacing + 1),
+                self.sensor.width,
+            )
+        try:
+            rawpath = os.path.join(path, prefix + filename + ".npy")
+            mapped = np.lib.format.open_memmap(
+                rawpath,
+                mode="w+",
+                dtype=np.asarray(frames[0]).dtype,
+                shape=(len(frames),) + shape,
+            )
+            for n, frame in enumerate(frames):
+                mapped[n] = np.reshape(frame, shape)
+            mapped.flush()
+        except Exception as e:
+            err = self.logerr + "saveRaw: unable to save frames: " + str(e)
+            logging.error(err)
+            return err, None
+        return err, mapped
+
     def dumpNumpy(
         self, datastream, path=None, filename="Dump", prefix=None,
     ):
@@ -1394,7 +2137,7 @@ class CameraAssembler:
           to parse headers or separate into individual frames is made.
 
         Args:
-            datastream: string to be saved
+            datastream: hexadecimal string (or raw bytes) to be saved
             path: save path, defaults to './output'
             filename: defaults to 'Dump'
             prefix: prepended to 'filename', defaults to time/date
@@ -1409,9 +2152,12 @@ class CameraAssembler:
             path = os.path.join(os.getcwd(), "output")
         if prefix is None:
             prefix = time.strftime("%y%m%d-%H%M%S_", time.localtime())
-        if not os.path.exists(path):
-            os.makedirs(path)
-        npdata = self.str2nparray(datastream)
+        self.makePath(path)
+        if isinstance(datastream, str):
+            datastream = self.str2bytes(datastream[: 4 * (len(datastream) // 4)])
+        # view the bytes in place as big-endian 16-bit words; the byte order is recorded
+        #   in the .npy header, so no swapped copy of the dump is made
+        npdata = np.frombuffer(datastream, dtype=">u2", count=len(datastream) // 2)
         try:
             nppath = os.path.join(path, prefix + filename + ".npy")
             np.save(nppath, npdata)
@@ -1420,13 +2166,17 @@ class CameraAssembler:
             logging.error(err)
         return err
 
-    def plotFrames(self, frames, index=None):
+    def plotFrames(self, frames, index=None, full=False):
         """
-        Plot frame or list of frames as individual graphs.
+        Plot frame or list of frames as individual graphs. By default, integer frames
+          are plotted as 8-bit previews (downsampled to at most 1024 pixels on the long
+          axis); use 'full=True' to plot the unmodified data.
 
         Args:
-            frames: numpy array or list of numpy arrays
+            frames: numpy array or list of numpy arrays (or 3D array of
+              frames, e.g., from saveRaw)
             index: number to start frame numbering
+            full: if True, plot full-resolution, full-depth frames
 
         Returns:
             Error string
@@ -1438,6 +2188,8 @@ class CameraAssembler:
         else:
             nframe = index
 
+        if isinstance(frames, np.ndarray) and frames.ndim == 3:
+            frames = list(frames)  # e.g., memory map from saveRaw; list of views
         if type(frames) is not list:
             frames = [frames]
 
@@ -1462,6 +2214,11 @@ class CameraAssembler:
                 err = self.logerr + "plotFrames: unable to plot frame"
                 logging.error(err)
                 continue
+            if not full and frame.dtype.kind in "iu":
+                ds = max(1, -(-max(frame.shape) // 1024))
+                frame = frame[::ds, ::ds]
+                shift = max(int(frame.max()).bit_length() - 8, 0)
+                frame = (frame >> shift).astype(np.uint8)
             plt.imshow(frame, cmap="gray")
             name = "Frame %d" % nframe
             plt.title(name)
@@ -1483,31 +2240,42 @@ class CameraAssembler:
         CRC_calc = crc16pure.crc16xmodem(self.str2bytes(rval[:-4]))
         return CRC_calc == data_crc
 
-    def checkRegSet(self, regname, teststring):
+    def checkRegSet(self, regname, teststring, detail=False):
         """
         Quick check to confirm that data read from register matches data write
 
         Args:
             regname: register to test
             teststring: value to assign to register, as hexadecimal string without '0x'
+            detail: if True, return the mismatched bits instead of a boolean
 
         Returns:
             boolean, True if read and write values match
+            if detail: integer, bits that differ between read and write values (0 if
+              they match)
         """
         self.setRegister(regname, teststring)
         # tell board to send data; wait to clear before interrogating register contents
         if regname == "SRAM_CTL":
-            time.sleep(2)
             if self.commname == "rs422":
+                time.sleep(2)
                 logging.info(
                     self.loginfo + "skipping 'SRAM_CTL' register check for RS422"
                 )
-                return True
+                return 0 if detail else True
+            delays = (2,)
         else:
-            time.sleep(0.1)
-        temp = self.getRegister(regname)
-        resp = temp[1].upper()
-        if resp != teststring.upper():
+            # poll with increasing delays rather than always waiting 0.1 s; the last
+            #   read still comes 0.1 s after the write
+            delays = (2e-4, 8e-4, 4e-3, 1.5e-2, 8e-2)
+        for delay in delays:
+            time.sleep(delay)
+            temp = self.getRegister(regname)
+            resp = temp[1].upper()
+            diff = self.regDiff(resp, teststring)
+            if not diff:
+                break
+        if diff:
             logging.error(
                 self.logerr
                 + "checkRegSet failure: "
@@ -1517,8 +2285,71 @@ class CameraAssembler:
                 + " ; read: "
                 + resp
             )
-            return False
-        return True
+        if detail:
+            return diff
+        return not diff
+
+    def checkRegSets(self, messages, settle=0.1, detail=False):
+        """
+        Confirm that data read from several registers matches data written, using one
+          exchange for the writes and one for the reads where the comms interface
+          supports it (see setRegisters and getRegisters)
+
+        Args:
+            messages: list of tuples (register name, value to assign to register as
+              hexadecimal string without '0x')
+            settle: single delay in seconds between the writes and the reads, shared
+              by all registers
+            detail: if True, return the mismatched bits instead of booleans
+
+        Returns:
+            list of booleans, True where read and write values match
+            if detail: list of integers, bits that differ between read and write
+              values (0 where they match)
+        """
+        diffs = [0] * len(messages)
+        batched = []
+        for i, (regname, teststring) in enumerate(messages):
+            if regname.upper() == "SRAM_CTL":  # needs special handling
+                diffs[i] = self.checkRegSet(regname, teststring, detail=True)
+            else:
+                batched.append(i)
+        if batched:
+            self.setRegisters([messages[i] for i in batched])
+            time.sleep(settle)  # let all registers settle before interrogating them
+            _, resps = self.getRegisters([messages[i][0] for i in batched])
+            for i, resp in zip(batched, resps):
+                regname, teststring = messages[i]
+                diffs[i] = self.regDiff(resp, teststring)
+                if diffs[i]:
+                    logging.error(
+                        self.logerr
+                        + "checkRegSets failure: "
+                        + regname
+                        + " ; set: "
+                        + teststring
+                        + " ; read: "
+                        + resp
+                    )
+        if detail:
+            return diffs
+        return [not diff for diff in diffs]
+
+    def regDiff(self, resp, teststring):
+        """
+        Compares register contents read with those written
+
+        Args:
+            resp: register contents read, as hexadecimal string without '0x'
+            teststring: register contents written, as hexadecimal string without '0x'
+
+        Returns:
+            integer, bits that differ (all bits if 'resp' is not a valid hex string)
+        """
+        try:
+            return int(resp, 16) ^ int(teststring, 16)
+        except ValueError:
+            return 0xFFFFFFFF
 
     def initPowerCheck(self):
         """
@@ -1591,11 +2422,7 @@ class CameraAssembler:
         logging.info(
             self.loginfo
             + "Python version: "
-            + str(self.python)
-            + "."
-            + str(self.pyth1)
-            + "."
-            + str(self.pyth2)
+            + platform.python_version()
         )
         logging.info(self.loginfo + "nsCamera software version: " + self.version)
         logging.info(self.loginfo + "FPGA firmware version: " + self.FPGAVersion)
@@ -1628,26 +2455,24 @@ class CameraAssembler:
             Sorted list: [register name (register address) : register contents as
               hexadecimal string without '0x']
         """
-        dump = {}
-        for key in self.board.registers.keys():
-            err, rval = self.getRegister(key)
-            dump[key] = rval
-        reglistmax = int(max(self.board.registers.values()), 16)
-        dumplist = [0] * (reglistmax + 1)
+        regnames = list(self.board.registers.keys())
+        err, rvals = self.getRegisters(regnames)
+        dump = dict(zip(regnames, rvals))
+        byaddr = {}  # keyed by address, so an alias replaces an earlier name
         for k, v in dump.items():
             regnum = self.board.registers[k]
-            dumplist[int(regnum, 16)] = (
+            byaddr[int(regnum, 16)] = (
                 "(" + regnum + ") {0:<24} {1}".format(k, v.upper())
             )
-        reglist = [a for a in dumplist if a]
+        reglist = [byaddr[addr] for addr in sorted(byaddr)]
         return reglist
 
     def dumpSubregisters(self):
         """
         List contents of all subregisters in board.channel_lookups and
-          board.monitor_lookups.
-        WARNING: some registers will reset when read- only the first subregister from
-          such a register will return the correct value, the remainder will return zeros
+          board.monitor_lookups. All registers are read in one batch (see
+          getSubregisters), each only once.
+        WARNING: some registers will reset when read
 
         DEPRECATED: use dumpStatus() instead
 
@@ -1655,72 +2480,49 @@ class CameraAssembler:
             dictionary  {subregister name : subregister contents as binary string
               without initial '0b'}
         """
+        subregnames = self.board.subreglist
+        err, resps = self.getSubregisters(subregnames)
+        if err:
+            logging.warning(
+                self.logwarn + "dumpSubregisters: unable to read all subregisters"
+            )
         dump = {}
-        for sub in self.board.subreglist:
-            key = sub.name
-            err, resp = self.getSubregister(key)
-            if err:
-                logging.warning(
-                    self.logwarn + "dumpSubregisters: unable to read subregister " + key
-                )
-            val = hex(int(resp, 2))
-            dump[key] = val
+        for key, resp in zip(subregnames, resps):
+            dump[key] = hex(int(resp, 2))
         return dump
 
-    def str2bytes(self, astring):
-        """
-        Python-version-agnostic converter of hexadecimal strings to bytes
+    # hexadecimal string (without '0x') <-> bytes converters; bound directly to the
+    #   builtin implementations so that calls do not pass through a Python frame
+    str2bytes = staticmethod(binascii.a2b_hex)
+    bytes2str = staticmethod(bytes.hex)
 
-        Args:
-            astring: hexadecimal string without '0x'
-
-        Returns:
-            byte string equivalent to input string
-        """
-        if self.PY3:
-            dbytes = binascii.a2b_hex(astring)
-        else:
-            dbytes = astring.decode("hex")
-        return dbytes
-
-    def bytes2str(self, bytesequence):
-        """
-        Python-version-agnostic converter of bytes to hexadecimal strings
-
-        Args:
-            bytesequence: sequence of bytes as string (Py2) or bytes (Py3)
-
-        Returns:
-            hexadecimal string representation of 'bytes' without '0x'
-        """
-        estring = binascii.b2a_hex(bytesequence)
-        if self.PY3:
-            estring = str(estring)[2:-1]
-        return estring
-
-    def str2nparray(self, valstring):
+    def str2nparray(self, valstring, out=None):
         """
         Convert string into array of uint16s
 
         Args:
             valstring: string of hexadecimal characters
+            out: optional preallocated uint16 array; used if its size matches
 
         Returns:
             numpy array of uint16
         """
-        stringlen = len(valstring)
-        arraylen = int(stringlen / 4)
-        outarray = np.empty(int(arraylen), dtype="uint16")
-
-        for i in range(0, arraylen):
-            outarray[i] = int(valstring[4 * i : 4 * i + 4], 16)
-        return outarray
+        arraylen = len(valstring) // 4
+        if len(valstring) != 4 * arraylen:
+            valstring = valstring[: 4 * arraylen]  # only copy to drop a partial word
+        # decode hex to bytes in C, then view as big-endian 16-bit words; copying into
+        #   the native-order output array performs the byte swap in one vectorized pass
+        words = np.frombuffer(self.str2bytes(valstring), dtype=">u2")
+        if out is not None and out.size == arraylen:
+            np.copyto(out, words)
+            return out
+        return words.astype("uint16")
 
     def flatten(self, x):
         """
         Flatten list of lists into single list
         """
-        if isinstance(x, collections.Iterable):
+        if isinstance(x, collections.abc.Iterable):
             return [a for i in x for a in self.flatten(i)]
         else:
             return [x]
@@ -1732,10 +2534,7 @@ class CameraAssembler:
         Args:
             text: message asking for keypress
         """
-        if self.PY3:
-            input(text)
-        else:
-            raw_input(text)
+        input(text)
 
     def mmReadoff(self, waitOnSRAM, variation=None):
         """
@@ -1755,7 +2554,14 @@ class CameraAssembler:
         if variation == "LastFrame":
             return frames[self.sensor.nframes - 1]
         elif variation == "Average":
-            return np.sum(frames, axis=0) // self.sensor.nframes
+            # accumulate in place rather than stacking all frames into a new array
+            total = np.zeros(
+                np.shape(frames[0]), dtype=np.result_type(frames[0], np.uint32)
+            )
+            for frame in frames:
+                total += frame
+            total //= self.sensor.nframes
+            return total
         elif variation == "Landscape":
             shaped = [np.reshape(frame, (1024, 512)) for frame in frames]
             return np.concatenate(shaped, axis=1)
@@ -1792,8 +2598,8 @@ class CameraAssembler:
             logging.error(err)
             return err
 
-        initframe = hex(minframe)[2:].zfill(8)
-        finframe = hex(maxframe)[2:].zfill(8)
+        initframe = "%08x" % minframe
+        finframe = "%08x" % maxframe
         err1, _ = self.setRegister("FPA_FRAME_INITIAL", initframe)
         err2, _ = self.setRegister("FPA_FRAME_FINAL", finframe)
         self.sensor.firstframe = minframe
@@ -1855,8 +2661,8 @@ class CameraAssembler:
             logging.error(err)
             return err
 
-        initrow = hex(minrow)[2:].zfill(8)
-        finrow = hex(maxrow)[2:].zfill(8)
+        initrow = "%08x" % minrow
+        finrow = "%08x" % maxrow
         err1, _ = self.setRegister("FPA_ROW_INITIAL", initrow)
         err2, _ = self.setRegister("FPA_ROW_FINAL", finrow)
         self.sensor.firstrow = minrow
@@ -1898,42 +2704,111 @@ class CameraAssembler:
             )
         return err
 
-    def generateFrames(self, data):
+    def generateFrames(self, data, pooled=False):
         """
         Processes data stream from board into frames and applies sensor-specific
           parsing. Generates padded data for fullsize option of setRows.
 
         Args:
-            data: stream from board.
+            data: stream from board (or uint16 array already decoded from one)
+            pooled: if True, decode into a buffer from the frame pool (see
+              allocateFrameBuffers); the caller must then release the frames
 
         Returns: list of parsed frames
         """
-        allframes = self.str2nparray(data)
+        buf = None
+        if isinstance(data, np.ndarray):
+            allframes = data
+        else:
+            if pooled:
+                buf = self.acquireFrameBuffer()
+            allframes = self.str2nparray(data, out=buf)
         # self.oldtime = self.currtime
         # self.currtime = time.time()
         # self.unstringed.append(self.currtime - self.oldtime)
-        frames = [0] * self.sensor.nframes
+        nframes = self.sensor.nframes
         framesize = self.sensor.width * self.sensor.height
+        if allframes.size == nframes * framesize:
+            # one (frame, pixel) view of the whole readoff instead of a slice per frame
+            frames = allframes.reshape(nframes, framesize)
+        else:  # incomplete readoff
+            frames = [
+                allframes[n * framesize : (n + 1) * framesize] for n in range(nframes)
+            ]
         if self.padToFull:
-            toprows = self.sensor.firstrow
-            botrows = (self.sensor.maxheight - 1) - self.sensor.lastrow
-            for n in range(self.sensor.nframes):
-                padtop = np.zeros(toprows * self.sensor.maxwidth, dtype=int)
-                padbot = np.zeros(botrows * self.sensor.maxwidth, dtype=int)
-                thisframe = np.concatenate(
-                    (padtop, allframes[n * framesize : (n + 1) * framesize], padbot)
-                )
-                frames[n] = thisframe
-        else:
-            for n in range(self.sensor.nframes):
-                frames[n] = allframes[n * framesize : (n + 1) * framesize]
+            toplen = self.sensor.firstrow * self.sensor.maxwidth
+            botlen = (
+                (self.sensor.maxheight - 1) - self.sensor.lastrow
+            ) * self.sensor.maxwidth
+            padded = np.zeros((nframes, toplen + framesize + botlen), dtype=int)
+            for n, frame in enumerate(frames):
+                padded[n, toplen : toplen + len(frame)] = frame
+            frames = padded
+        frames = list(frames)
         self.clearStatus()
         parsed = self.parseReadoff(frames)
+        # the pool buffer goes straight back if the parsed frames do not use it (the
+        #   readoff size changed, the frames were padded, or the sensor copied them)
+        if buf is not None and not any(
+            np.may_share_memory(frame, buf) for frame in parsed
+        ):
+            self.framepool.append(buf)
         # self.oldtime = self.currtime
         # self.currtime = time.time()
         # self.parsedtime.append(self.currtime - self.oldtime)
         return parsed
 
+    def allocateFrameBuffers(self, count=2):
+        """
+        Preallocate 'count' reusable buffers sized for the current frame and row
+          settings. While buffers remain in the pool, readoff (and batchAcquire with
+          overlap) fills one of them instead of allocating a new array for each
+          readoff; frames returned by readoff are views into that buffer and must be
+          handed back with releaseFrames() once they are no longer needed. If the
+          frames do not use the buffer (padded frames, sensors that copy while
+          parsing, or a readoff size that no longer matches), it returns to the pool
+          at once. Call again after
+          setFrames or setRows to resize the pool.
+
+        Args:
+            count: number of buffers (e.g., 2 to acquire into one while the other is
+              being saved)
+        """
+        size = self.sensor.nframes * self.sensor.width * self.sensor.height
+        self.framepool = [np.empty(size, dtype="uint16") for _ in range(count)]
+        self.framepoolids = {id(buf): buf for buf in self.framepool}
+
+    def acquireFrameBuffer(self):
+        """
+        Take a buffer from the frame pool
+
+        Returns:
+            numpy array of uint16, or None if the pool is empty
+        """
+        if self.framepool:
+            return self.framepool.pop()
+        return None
+
+    def releaseFrames(self, frames):
+        """
+        Return the buffer underlying 'frames' to the frame pool. Frames (and any other
+          views of the buffer) must not be used afterwards, since the next readoff will
+          overwrite them. Frames that do not come from the pool are ignored.
+
+        Args:
+            frames: list of frames returned by readoff or generateFrames
+        """
+        if type(frames) is not list:
+            frames = [frames]
+        for frame in frames:
+            buf = frame
+            while isinstance(buf, np.ndarray) and buf.base is not None:
+                buf = buf.base
+            if self.framepoolids.get(id(buf)) is buf and not any(
+                buf is pooled for pooled in self.framepool
+            ):
+                self.framepool.append(buf)
+
     def abortReadoff(self, flag=True):
         """
         Simple abort command for readoff in waiting mode--does not interrupt download in
@@ -1956,9 +2831,19 @@ class CameraAssembler:
         filename="Frame",
         prefix=None,
         showProgress=0,
+        overlap=False,
     ):
         """
         Acquire a series of images as fast as possible, then process and save to disk.
+          Each readoff is decoded into a temporary memory-mapped file in the output
+          directory as it arrives, so memory use does not grow with 'sets'.
+
+        With 'overlap', each set is instead parsed right after its readoff and handed
+          to a FrameWriter thread, so that saving a set overlaps with acquiring the
+          next one. This is faster overall when saving takes about as long as
+          acquisition, at the cost of a longer interval between acquisitions. If frame
+          buffers have been allocated (see allocateFrameBuffers), they are reused from
+          one set to the next.
 
         Args:
             sets: Number of acquisitions to perform
@@ -1969,11 +2854,22 @@ class CameraAssembler:
               overwriting)
             showProgress: if non-zero, show notice every 'showProgress' acquisitions and
               print total acquisition time
+            overlap: if True, save each set in a background thread during the following
+              acquisitions
 
         Returns:
             Time taken for acquisition (seconds)
         """
-        datalist = ["0"] * sets
+        if path is None:
+            path = os.path.join(os.getcwd(), "output")
+        self.makePath(path)
+        if overlap:
+            writer = FrameWriter(self, [self.saveTiffs])
+        else:
+            size = self.sensor.nframes * self.sensor.width * self.sensor.height
+            spill = tempfile.TemporaryFile(dir=path)
+            rawlist = np.memmap(spill, dtype="uint16", mode="w+", shape=(sets, size))
+        datalist = {}  # readoffs of unexpected length, kept as strings
         timelist = [datetime.now()] * sets
         logging.info(
             self.loginfo
@@ -1987,8 +2883,21 @@ class CameraAssembler:
                 print(self.loginfo + "batchAcquire: Acquiring set " + str(i + 1))
             self.arm(trig)
             data, datalen, data_err = self.readoff(fast=True)
-            datalist[i] = data
             timelist[i] = datetime.now()
+            if overlap:
+                # parse here, since generateFrames talks to the board; only the save
+                #   is handed to the writer thread
+                writer.submit(
+                    self.generateFrames(data, pooled=True),
+                    release=True,
+                    path=path,
+                    filename=filename,
+                    prefix=self.setPrefix(timelist[i], prefix),
+                )
+            else:
+                row = rawlist[i]  # each index creates a new view, so bind it once
+                if self.str2nparray(data, out=row) is not row:
+                    datalist[i] = data
         afterread = time.time()
         if showProgress:
             print(
@@ -1999,23 +2908,49 @@ class CameraAssembler:
                 + str(sets)
                 + " sets"
             )
-        setnum = 0
-        if path is None:
-            path = os.path.join(os.getcwd(), "output")
-        for (imset, imtime) in zip(datalist, timelist):
-            setnum = setnum + 1
-            if showProgress and not setnum % showProgress:
-                print(self.loginfo + "batchAcquire: Saving set " + str(setnum))
-            parsed = self.generateFrames(imset)
-            if prefix is None:
-                setprefix = imtime.strftime("%y%m%d-%H%M%S%f")[:-2] + "_"
-            else:
-                setprefix = prefix
-            self.saveTiffs(parsed, path, filename, prefix=setprefix)
+        if overlap:
+            err = writer.join()
+            if err:
+                logging.error(err)
+            if showProgress:
+                print(
+                    self.loginfo
+                    + "batchAcquire: saving finished "
+                    + str(time.time() - afterread)
+                    + " seconds after acquisition"
+                )
+        else:
+            setnum = 0
+            for (imset, imtime) in zip(rawlist, timelist):
+                if setnum in datalist:
+                    imset = datalist[setnum]
+                setnum = setnum + 1
+                if showProgress and not setnum % showProgress:
+                    print(self.loginfo + "batchAcquire: Saving set " + str(setnum))
+                parsed = self.generateFrames(imset)
+                self.saveTiffs(
+                    parsed, path, filename, prefix=self.setPrefix(imtime, prefix)
+                )
+            spill.close()
         logging.getLogger().setLevel(self.verblevel)
         logging.info(self.loginfo + "batchAcquire: re-enabling logging")
         return afterread - beforeread
 
+    def setPrefix(self, settime, prefix=None):
+        """
+        Filename prefix for one set of batchAcquire
+
+        Args:
+            settime: datetime of acquisition
+            prefix: fixed prefix to use instead, if not None
+
+        Returns:
+            prefix string (e.g. '160830-1247041234_')
+        """
+        if prefix is not None:
+            return prefix
+        return settime.strftime("%y%m%d-%H%M%S%f")[:-2] + "_"
+
     def loadTextFrames(self, filename='frames.txt', path=None):
         """
         Load a image set previously saved as text and convert to frames. NOTE: to work
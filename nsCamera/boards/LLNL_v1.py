@@ -25,6 +25,28 @@ from collections import OrderedDict
 from nsCamera.utils.Packet import Packet
 from nsCamera.utils.Subregister import SubRegister
 
+# STAT_REG bits; test with 'status() & STATUS_...'
+STATUS_SENSOR_READ_COMPLETE = 1 << 0
+STATUS_COARSE_TRIGGER = 1 << 1
+STATUS_FINE_TRIGGER = 1 << 2
+STATUS_READOUT_IN_PROGRESS = 1 << 5
+STATUS_READOUT_COMPLETE = 1 << 6
+STATUS_SRAM_READOUT_STARTED = 1 << 7
+STATUS_SRAM_READOUT_COMPLETE = 1 << 8
+STATUS_HST_CONFIGURED = 1 << 9
+STATUS_ADCS_CONFIGURED = 1 << 10
+STATUS_POTS_CONFIGURED = 1 << 11
+STATUS_HST_ALL_W_EN = 1 << 12
+STATUS_TIMER_RESET = 1 << 13
+STATUS_ARMED = 1 << 14
+
+# STAT_REG2 bits; test with 'status2() & STATUS2_...'
+STATUS2_FPA_IF_TO = 1 << 0
+STATUS2_SRAM_RO_TO = 1 << 1
+STATUS2_PIXELRD_TO = 1 << 2
+STATUS2_UART_TX_TO_RST = 1 << 3
+STATUS2_UART_RX_TO_RST = 1 << 4
+
 
 class llnl_v1:
     """
@@ -245,6 +267,7 @@ class llnl_v1:
 
         self.rs422_baud = 921600
         self.rs422_cmd_wait = 0.3
+        self.SRAMpollmax = 0.02  # maximum interval (s) between waitForSRAM polls
 
         fpgaNum_pkt = Packet(cmd="1", addr=self.registers["FPGA_NUM"])
         fpgaRev_pkt = Packet(cmd="1", addr=self.registers["FPGA_REV"])
@@ -327,8 +350,10 @@ class llnl_v1:
             )
 
         self.subreglist = []
+        self.subregset = set()  # subreglist for membership tests
         for s in self.subregisters:
             self.subreglist.append(s[0].upper())
+            self.subregset.add(s[0].upper())
             sr = SubRegister(
                 self,
                 name=s[0].upper(),
@@ -468,6 +493,7 @@ class llnl_v1:
             )
             setattr(self, s[0].upper(), sr)
             self.subreglist.append(s[0])
+            self.subregset.add(s[0])
         self.ca.checkSensorVoltStat()
         control_messages = self.ca.sensorSpecific() + [
             # ring w/caps=01, relax=00, ring w/o caps = 02
@@ -590,14 +616,19 @@ class llnl_v1:
         control_messages = [("READ_SRAM", "1")]
         return self.ca.submitMessages(control_messages, " readSRAM: ")
 
-    def waitForSRAM(self, timeout):
+    def waitForSRAM(self, timeout=None, pollmax=None):
         """
         Wait until subreg 'SRAM_READY' flag is true or timeout is exceeded;
-          timeout = None or zero means wait indefinitely
+          timeout = None or zero means wait indefinitely. The firmware does not signal
+          completion, so the flag is polled; the interval between polls starts at 1 ms
+          and doubles up to 'pollmax' seconds to keep long waits (e.g., for a
+          hardware trigger) from saturating the CPU and the link
 
         Args:
             timeout - time in seconds before readoff proceeds automatically without
               waiting for SRAM_READY flag
+            pollmax - maximum interval in seconds between polls (defaults to
+              'SRAMpollmax')
 
         Returns:
             error string
@@ -606,6 +637,9 @@ class llnl_v1:
         waiting = True
         starttime = time.time()
         err = ""
+        pollinterval = 0.001
+        if pollmax is None:
+            pollmax = self.SRAMpollmax
         while waiting:
             err, status = self.ca.getSubregister("SRAM_READY")
             if err:
@@ -623,6 +657,9 @@ class llnl_v1:
                 err += self.logerr + "SRAM timeout; proceeding with download attempt"
                 logging.error(err)
                 return err
+            if waiting:
+                time.sleep(pollinterval)
+                pollinterval = min(2 * pollinterval, pollmax)
         return err
 
     def getTimer(self):
@@ -652,7 +689,7 @@ class llnl_v1:
         control_messages = [("RESET_TIMER", "1"), ("RESET_TIMER", "0")]
         return self.ca.submitMessages(control_messages, " resetTimer: ")
 
-    def enableLED(self, status):
+    def enableLED(self, status=1):
         """
         Enable/disable on-board LEDs
 
@@ -666,7 +703,7 @@ class llnl_v1:
             status = 1
         return self.ca.setSubregister("LED_EN", str(status))
 
-    def setLED(self, LED, status):
+    def setLED(self, LED=1, status=1):
         """
         Illuminate on-board LED
 
@@ -680,7 +717,7 @@ class llnl_v1:
         key = "LED" + str(LED)
         return self.ca.setSubregister(key, str(status))
 
-    def setPowerSave(self, status):
+    def setPowerSave(self, status=1):
         """
         Select powersave option
 
@@ -694,7 +731,7 @@ class llnl_v1:
             status = 1
         return self.ca.setSubregister("POWERSAVE", str(status))
 
-    def setPPER(self, time):
+    def setPPER(self, time=None):
         """
         Set polling period for ADCs.
         Args:
@@ -714,10 +751,10 @@ class llnl_v1:
             logging.error(err)
             return err, str(time)
         else:
-            binset = bin(time)[2:].zfill(8)
+            binset = "{0:08b}".format(time)
             return self.ca.setSubregister("PPER", binset)
 
-    def getTemp(self, scale):
+    def getTemp(self, scale=None):
         """
         Read temperature sensor
         Args:
@@ -742,7 +779,24 @@ class llnl_v1:
             temp = ctemp
         return temp
 
-    def getPressure(self, offset, sensitivity, units):
+    def snapshot(self):
+        """
+        Read timer, temperature sensor, and status register in a single exchange (see
+          CameraAssembler.getRegisters)
+
+        Returns:
+            tuple (timer value as integer, temperature in C as float, contents of status
+              register as integer)
+        """
+        err, rvals = self.ca.getRegisters(
+            ["TIMER_VALUE", "TEMP_SENSE_DATA", "STAT_REG"]
+        )
+        if err:
+            logging.error(self.logerr + "snapshot: unable to read telemetry registers")
+        ctemp = int(rvals[1][-3:], 16) / 16.0
+        return int(rvals[0], 16), ctemp, int(rvals[2], 16)
+
+    def getPressure(self, offset=None, sensitivity=None, units=None):
         """
         Read pressure sensor
 
@@ -770,13 +824,12 @@ class llnl_v1:
             logging.error(self.logerr + "clearStatus failed")
         return err
 
-    def checkStatus(self):
+    def status(self):
         """
-        Check status register, convert to reverse-order bit stream (i.e., bit 0 is
-          statusbits[0])
+        Read status register
 
         Returns:
-            bit string (no '0b') in reversed order
+            contents of status register as integer; test bits using STATUS_ masks
         """
         err, rval = self.ca.getRegister("STAT_REG")
         if not rval:
@@ -784,16 +837,14 @@ class llnl_v1:
                 self.logerr + "Unable to check status register (zeroes returned)"
             )
             rval = "0"
-        rvalbits = bin(int(rval, 16))[2:].zfill(32)
-        statusbits = rvalbits[::-1]
-        return statusbits  # TODO: add error handling
+        return int(rval, 16)
 
-    def checkStatus2(self):
+    def status2(self):
         """
-        Check second status register, convert to reverse-order bit stream (i.e., bit 0
-          is statusbits[0])
+        Read second status register
 
-        Returns: bit string (no '0b') in reversed order
+        Returns:
+            contents of status register 2 as integer; test bits using STATUS2_ masks
         """
         err, rval = self.ca.getRegister("STAT_REG2")
         if not rval:
@@ -801,57 +852,74 @@ class llnl_v1:
                 self.logerr + "Unable to check status register 2 (zeroes returned)"
             )
             rval = "0"
-        rvalbits = bin(int(rval, 16))[2:].zfill(5)
-        statusbits = rvalbits[::-1]
-        return statusbits  # TODO: add error handling
+        return int(rval, 16)
+
+    def checkStatus(self):
+        """
+        Check status register, convert to reverse-order bit stream (i.e., bit 0 is
+          statusbits[0])
+
+        Returns:
+            bit string (no '0b') in reversed order
+        """
+        return "{0:032b}".format(self.status())[::-1]
+
+    def checkStatus2(self):
+        """
+        Check second status register, convert to reverse-order bit stream (i.e., bit 0
+          is statusbits[0])
+
+        Returns: bit string (no '0b') in reversed order
+        """
+        return "{0:05b}".format(self.status2())[::-1]
 
     def reportStatus(self):
         """
         Check contents of status register, print relevant messages
         """
-        statusbits = self.checkStatus()
-        statusbits2 = self.checkStatus2()
+        status = self.status()
+        status2 = self.status2()
         logging.info(self.loginfo + "Status report:")
-        if int(statusbits[0]):
+        if status & STATUS_SENSOR_READ_COMPLETE:
             logging.info(self.loginfo + "Sensor read complete")
-        if int(statusbits[1]):
+        if status & STATUS_COARSE_TRIGGER:
             logging.info(self.loginfo + "Coarse trigger detected")
-        if int(statusbits[2]):
+        if status & STATUS_FINE_TRIGGER:
             logging.info(self.loginfo + "Fine trigger detected")
-        if int(statusbits[5]):
+        if status & STATUS_READOUT_IN_PROGRESS:
             logging.info(self.loginfo + "Sensor readout in progress")
-        if int(statusbits[6]):
+        if status & STATUS_READOUT_COMPLETE:
             logging.info(self.loginfo + "Sensor readout complete")
-        if int(statusbits[7]):
+        if status & STATUS_SRAM_READOUT_STARTED:
             logging.info(self.loginfo + "SRAM readout started")
-        if int(statusbits[8]):
+        if status & STATUS_SRAM_READOUT_COMPLETE:
             logging.info(self.loginfo + "SRAM readout complete")
-        if int(statusbits[9]):
+        if status & STATUS_HST_CONFIGURED:
             logging.info(self.loginfo + "High-speed timing configured")
-        if int(statusbits[10]):
+        if status & STATUS_ADCS_CONFIGURED:
             logging.info(self.loginfo + "All ADCs configured")
-        if int(statusbits[11]):
+        if status & STATUS_POTS_CONFIGURED:
             logging.info(self.loginfo + "All pots configured")
-        if int(statusbits[13]):
+        if status & STATUS_TIMER_RESET:
             logging.info(self.loginfo + "Timer has reset")
-        if int(statusbits[14]):
+        if status & STATUS_ARMED:
             logging.info(self.loginfo + "Camera is Armed")
-        self.ca.sensor.reportStatusSensor(statusbits)
-        temp = int(statusbits[27:15:-1], 2) / 16.0
+        self.ca.sensor.reportStatusSensor(status)
+        temp = ((status >> 16) & 0xFFF) / 16.0
         logging.info(
             self.loginfo + "Temperature reading: " + "{0:1.2f}".format(temp) + " C"
         )
-        press = int(statusbits[:27:-1], 2)
+        press = status >> 28
         logging.info(self.loginfo + "Pressure reading: " + "{0:1.2f}".format(press))
-        if int(statusbits2[0]):
+        if status2 & STATUS2_FPA_IF_TO:
             logging.info(self.loginfo + "FPA_IF_TO")
-        if int(statusbits2[1]):
+        if status2 & STATUS2_SRAM_RO_TO:
             logging.info(self.loginfo + "INFO: [LLNL_v1] SRAM_RO_TO")
-        if int(statusbits2[2]):
+        if status2 & STATUS2_PIXELRD_TO:
             logging.info(self.loginfo + "PixelRd Timeout Error")
-        if int(statusbits2[3]):
+        if status2 & STATUS2_UART_TX_TO_RST:
             logging.info(self.loginfo + "UART_TX_TO_RST")
-        if int(statusbits2[4]):
+        if status2 & STATUS2_UART_RX_TO_RST:
             logging.info(self.loginfo + "UART_RX_TO_RST")
 
     def reportEdgeDetects(self):
@@ -912,10 +980,9 @@ class llnl_v1:
                 val = str(round(self.ca.getMonV(entry), 3)) + " V"
                 MonDict[entry] = val
 
-        regDict = OrderedDict()
-        for key in self.registers.keys():
-            err, rval = self.ca.getRegister(key)
-            regDict[key] = rval
+        regnames = list(self.registers.keys())
+        err, rvals = self.ca.getRegisters(regnames)
+        regDict = OrderedDict(zip(regnames, rvals))
 
         dumpDict = OrderedDict()
         for x in [statDict, MonDict, POTDict, regDict]:
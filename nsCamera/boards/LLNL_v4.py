@@ -25,6 +25,31 @@ from collections import OrderedDict
 from nsCamera.utils.Packet import Packet
 from nsCamera.utils.Subregister import SubRegister
 
+# STAT_REG bits; test with 'status() & STATUS_...'
+STATUS_SENSOR_READ_COMPLETE = 1 << 0
+STATUS_COARSE_TRIGGER = 1 << 1
+STATUS_FINE_TRIGGER = 1 << 2
+STATUS_W3_TOP_L_EDGE1 = 1 << 3
+STATUS_W3_TOP_R_EDGE1 = 1 << 4
+STATUS_READOUT_IN_PROGRESS = 1 << 5
+STATUS_READOUT_COMPLETE = 1 << 6
+STATUS_SRAM_READOUT_STARTED = 1 << 7
+STATUS_SRAM_READOUT_COMPLETE = 1 << 8
+STATUS_HST_CONFIGURED = 1 << 9
+STATUS_ADCS_CONFIGURED = 1 << 10
+STATUS_DACS_CONFIGURED = 1 << 11
+STATUS_HST_ALL_W_EN = 1 << 12
+STATUS_TIMER_RESET = 1 << 13
+STATUS_ARMED = 1 << 14
+
+# STAT_REG2 bits; test with 'status2() & STATUS2_...'
+STATUS2_FPA_IF_TO = 1 << 0
+STATUS2_SRAM_RO_TO = 1 << 1
+STATUS2_PIXELRD_TO = 1 << 2
+STATUS2_UART_TX_TO_RST = 1 << 3
+STATUS2_UART_RX_TO_RST = 1 << 4
+STATUS2_PDBIAS_UNREADY = 1 << 5
+
 
 class llnl_v4:
     """
@@ -230,6 +255,7 @@ class llnl_v4:
         self.ADC5_bipolar = False
         self.rs422_baud = 921600
         self.rs422_cmd_wait = 0.3
+        self.SRAMpollmax = 0.02  # maximum interval (s) between waitForSRAM polls
 
         fpgaNum_pkt = Packet(cmd="1", addr=self.registers["FPGA_NUM"])
         fpgaRev_pkt = Packet(cmd="1", addr=self.registers["FPGA_REV"])
@@ -333,8 +359,10 @@ class llnl_v4:
                 }
             )
         self.subreglist = []
+        self.subregset = set()  # subreglist for membership tests
         for s in self.subregisters:
             self.subreglist.append(s[0].upper())
+            self.subregset.add(s[0].upper())
             sr = SubRegister(
                 self,
                 name=s[0].upper(),
@@ -424,6 +452,7 @@ class llnl_v4:
             )
             setattr(self, s[0].upper(), sr)
             self.subreglist.append(s[0])
+            self.subregset.add(s[0])
         # self.ca.checkSensorVoltStat() # SENSOR_VOLT_STAT and SENSOR_VOLT_CTL are
         #   deactivated for v4 icarus and daedalus firmware for now.
         control_messages = self.ca.sensorSpecific() + [
@@ -541,14 +570,19 @@ class llnl_v4:
         control_messages = [("READ_SRAM", "1")]
         return self.ca.submitMessages(control_messages, " readSRAM: ")
 
-    def waitForSRAM(self, timeout):
+    def waitForSRAM(self, timeout=None, pollmax=None):
         """
         Wait until subreg 'SRAM_READY' flag is true or timeout is exceeded;
-          timeout = None or zero means wait indefinitely
+          timeout = None or zero means wait indefinitely. The firmware does not signal
+          completion, so the flag is polled; the interval between polls starts at 1 ms
+          and doubles up to 'pollmax' seconds to keep long waits (e.g., for a
+          hardware trigger) from saturating the CPU and the link
 
         Args:
             timeout - time in seconds before readoff proceeds automatically without
               waiting for SRAM_READY flag
+            pollmax - maximum interval in seconds between polls (defaults to
+              'SRAMpollmax')
 
         Returns:
             error string
@@ -557,6 +591,9 @@ class llnl_v4:
         waiting = True
         starttime = time.time()
         err = ""
+        pollinterval = 0.001
+        if pollmax is None:
+            pollmax = self.SRAMpollmax
         while waiting:
             err, status = self.ca.getSubregister("SRAM_READY")
             if err:
@@ -573,6 +610,9 @@ class llnl_v4:
                 err += self.logerr + "SRAM timeout; proceeding with download attempt"
                 logging.error(err)
                 return err
+            if waiting:
+                time.sleep(pollinterval)
+                pollinterval = min(2 * pollinterval, pollmax)
 
         return err
 
@@ -603,7 +643,7 @@ class llnl_v4:
         control_messages = [("RESET_TIMER", "1"), ("RESET_TIMER", "0")]
         return self.ca.submitMessages(control_messages, " resetTimer: ")
 
-    def enableLED(self, status):
+    def enableLED(self, status=1):
         """
         Dummy function; feature is not implemented on Icarus
 
@@ -612,7 +652,7 @@ class llnl_v4:
         """
         return "", "0"
 
-    def setLED(self, LED, status):
+    def setLED(self, LED=1, status=1):
         """
         Dummy function; feature is not implemented on Icarus
 
@@ -621,7 +661,7 @@ class llnl_v4:
         """
         return "", "0"
 
-    def setPowerSave(self, status):
+    def setPowerSave(self, status=1):
         """
         Select powersave option
 
@@ -635,7 +675,7 @@ class llnl_v4:
             status = 1
         return self.ca.setSubregister("POWERSAVE", str(status))
 
-    def setPPER(self, time):
+    def setPPER(self, time=None):
         """
         Set polling period for ADCs.
         Args:
@@ -655,10 +695,10 @@ class llnl_v4:
             logging.error(err)
             return err, str(time)
         else:
-            binset = bin(time)[2:].zfill(8)
+            binset = "{0:08b}".format(time)
             return self.ca.setSubregister("PPER", binset)
 
-    def getTemp(self, scale):
+    def getTemp(self, scale=None):
         """
         Read temperature sensor
         Args:
@@ -683,7 +723,27 @@ class llnl_v4:
             temp = ctemp
         return temp
 
-    def getPressure(self, offset, sensitivity, units):
+    def snapshot(self):
+        """
+        Read timer, temperature monitor, and status register in a single exchange (see
+          CameraAssembler.getRegisters)
+
+        Returns:
+            tuple (timer value as integer, temperature in C as float, contents of status
+              register as integer)
+        """
+        _, tempobj, _ = self.ca.resolveSubreg(self.ca.resolveMonitor("MON_TEMP"))
+        err, rvals = self.ca.getRegisters(
+            ["TIMER_VALUE", tempobj.register, "STAT_REG"]
+        )
+        if err:
+            logging.error(self.logerr + "snapshot: unable to read telemetry registers")
+        monval = (int(rvals[1], 16) >> tempobj.shift) & tempobj.max_value
+        monval = (monval - tempobj.min) / (1.0 * tempobj.max - tempobj.min)
+        ctemp = self.ca.monToV(monval) * 1000 - 273.15
+        return int(rvals[0], 16), ctemp, int(rvals[2], 16)
+
+    def getPressure(self, offset=None, sensitivity=None, units=None):
         """
         Read pressure sensor. Uses default offset and sensitivity defined in init
           function unless alternatives are specified. NOTE: to reset defaults, reassign
@@ -738,6 +798,26 @@ class llnl_v4:
             logging.error(self.logerr + "clearStatus failed")
         return err
 
+    def status(self):
+        """
+        Read status register
+
+        Returns:
+            contents of status register as integer; test bits using STATUS_ masks
+        """
+        err, rval = self.ca.getRegister("STAT_REG")
+        return int(rval, 16)
+
+    def status2(self):
+        """
+        Read second status register
+
+        Returns:
+            contents of status register 2 as integer; test bits using STATUS2_ masks
+        """
+        err, rval = self.ca.getRegister("STAT_REG2")
+        return int(rval, 16)
+
     def checkStatus(self):
         """
         Check status register, convert to reverse-order bit stream (i.e., bit 0 is
@@ -746,10 +826,7 @@ class llnl_v4:
         Returns:
             bit string (no '0b') in reversed order
         """
-        err, rval = self.ca.getRegister("STAT_REG")
-        rvalbits = bin(int(rval, 16))[2:].zfill(32)
-        statusbits = rvalbits[::-1]
-        return statusbits
+        return "{0:032b}".format(self.status())[::-1]
 
     def checkStatus2(self):
         """
@@ -758,64 +835,61 @@ class llnl_v4:
 
         Returns: bit string (no '0b') in reversed order
         """
-        err, rval = self.ca.getRegister("STAT_REG2")
-        rvalbits = bin(int(rval, 16))[2:].zfill(6)
-        statusbits = rvalbits[::-1]
-        return statusbits
+        return "{0:06b}".format(self.status2())[::-1]
 
     def reportStatus(self):
         """
         Check contents of status register, print relevant messages
         """
-        statusbits = self.checkStatus()
-        statusbits2 = self.checkStatus2()
+        status = self.status()
+        status2 = self.status2()
         print("Status report:")
         print("-------------")
-        if int(statusbits[0]):
+        if status & STATUS_SENSOR_READ_COMPLETE:
             print("Sensor read complete")
-        if int(statusbits[1]):
+        if status & STATUS_COARSE_TRIGGER:
             print("Coarse trigger detected")
-        if int(statusbits[2]):
+        if status & STATUS_FINE_TRIGGER:
             print("Fine trigger detected")
-        if int(statusbits[3]):
+        if status & STATUS_W3_TOP_L_EDGE1:
             print("W3_Top_L_Edge1 detected")
-        if int(statusbits[4]):
+        if status & STATUS_W3_TOP_R_EDGE1:
             print("W3_Top_R_Edge1 detected")
-        if int(statusbits[5]):
+        if status & STATUS_READOUT_IN_PROGRESS:
             print("Sensor readout in progress")
-        if int(statusbits[6]):
+        if status & STATUS_READOUT_COMPLETE:
             print("Sensor readout complete")
-        if int(statusbits[7]):
+        if status & STATUS_SRAM_READOUT_STARTED:
             print("SRAM readout started")
-        if int(statusbits[8]):
+        if status & STATUS_SRAM_READOUT_COMPLETE:
             print("SRAM readout complete")
-        if int(statusbits[9]):
+        if status & STATUS_HST_CONFIGURED:
             print("High-speed timing configured")
-        if int(statusbits[10]):
+        if status & STATUS_ADCS_CONFIGURED:
             print("All ADCs configured")
-        if int(statusbits[11]):
+        if status & STATUS_DACS_CONFIGURED:
             print("All DACs configured")
-        if int(statusbits[12]):
+        if status & STATUS_HST_ALL_W_EN:
             print("HST_All_W_En detected")
-        if int(statusbits[13]):
+        if status & STATUS_TIMER_RESET:
             print("Timer has reset")
-        if int(statusbits[14]):
+        if status & STATUS_ARMED:
             print("Camera is Armed")
-        temp = int(statusbits[23:16:-1], 2) * 3.3 * 1000 / 4096
+        temp = ((status >> 17) & 0x7F) * 3.3 * 1000 / 4096
         print("Temperature reading: " + "{0:1.2f}".format(temp) + " C")
-        press = int(statusbits[:23:-1], 2) * 3.3 * 1000 / 4096
+        press = (status >> 24) * 3.3 * 1000 / 4096
         print("Pressure sensor reading: " + "{0:1.2f}".format(press) + " mV")
-        if int(statusbits2[0]):
+        if status2 & STATUS2_FPA_IF_TO:
             print("FPA_IF_TO")
-        if int(statusbits2[1]):
+        if status2 & STATUS2_SRAM_RO_TO:
             print("SRAM_RO_TO")
-        if int(statusbits2[2]):
+        if status2 & STATUS2_PIXELRD_TO:
             print("PixelRd Timeout Error")
-        if int(statusbits2[3]):
+        if status2 & STATUS2_UART_TX_TO_RST:
             print("UART_TX_TO_RST")
-        if int(statusbits2[4]):
+        if status2 & STATUS2_UART_RX_TO_RST:
             print("UART_RX_TO_RST")
-        if int(statusbits2[5]):
+        if status2 & STATUS2_PDBIAS_UNREADY:
             print("PDBIAS Unready")
         print("-------------")
 
@@ -862,11 +936,12 @@ class llnl_v4:
         Returns:
             dictionary of system diagnostic values
         """
-        statusbits = self.checkStatus()
+        status = self.status()
+        statusbits = "{0:032b}".format(status)[::-1]
         statusbits2 = self.checkStatus2()
 
-        temp = int(statusbits[23:16:-1], 2) * 3.3 * 1000 / 4096
-        press = int(statusbits[:23:-1], 2) * 3.3 * 1000 / 4096
+        temp = ((status >> 17) & 0x7F) * 3.3 * 1000 / 4096
+        press = (status >> 24) * 3.3 * 1000 / 4096
 
         statDict = OrderedDict(
             {
@@ -907,10 +982,9 @@ class llnl_v4:
                 val = str(round(self.ca.getMonV(entry), 3)) + " V"
                 MonDict[entry] = val
 
-        regDict = OrderedDict()
-        for key in self.registers.keys():
-            err, rval = self.ca.getRegister(key)
-            regDict[key] = rval
+        regnames = list(self.registers.keys())
+        err, rvals = self.ca.getRegisters(regnames)
+        regDict = OrderedDict(zip(regnames, rvals))
 
         dumpDict = OrderedDict()
         for x in [statDict, MonDict, DACDict, regDict]:
@@ -19,6 +19,7 @@ Version: 2.1.1  (July 2021)
 import ctypes as C
 import logging
 import os.path
+import socket
 import sys
 import time
 
@@ -36,9 +37,13 @@ class GigE:
         readoff() - waits for data ready register flag, then copies camera image data
           into numpy arrays
         sendCMD(pkt) - sends packet object via serial port
+        sendCMDs(pkts) - sends list of packet objects in one write, collects responses
+          in one read
         readSerial(size, timeout) - read 'size' bytes from connection
         writeSerial(outstring) - submits string 'outstring' over connection
+        writeBytes(outbytes) - submits byte string 'outbytes' over connection
         closeDevice() - close connections and free resources
+        setRecvBuffer(size) - request TCP receive buffer size for connection
         getCardIP() - returns IP address of OT card
         getCardInfo() - prints report of details of OT card and connection
     """
@@ -65,6 +70,8 @@ class GigE:
             * self.ca.sensor.bytesperpixel
         )
         self.skipError = False
+        # receive buffer reused across reads; grown in readSerial when necessary
+        self.inbuff = C.create_string_buffer(self.payloadsize + 32)
 
         if self.ca.port:
             if isinstance(self.ca.port, int) and 0 < self.ca.port < 65536:
@@ -141,6 +148,8 @@ class GigE:
 
         self.Connection = C.c_void_p()
         self.openDevice()
+        if self.ca.rcvbuf:
+            self.setRecvBuffer(self.ca.rcvbuf)
 
     def sendCMD(self, pkt):
         """
@@ -154,25 +163,24 @@ class GigE:
         Returns:
             tuple (error, response string)
         """
-        pktStr = pkt.pktStr()[0:16]
         err = ""
-        self.ca.writeSerial(pktStr)
+        self.writeBytes(pkt.pktBytes()[0:8])
         if (
             hasattr(self.ca, "board")
-            and pktStr[4] == "0"
-            and pktStr[5:8] == self.ca.board.registers["SRAM_CTL"]
+            and pkt._cmd == "0"
+            and pkt._addr == self.ca.board.registers["SRAM_CTL"]
         ):
             bufsize = self.payloadsize + 16
-            resptext = self.readSerial(bufsize)
-            if len(resptext) < bufsize + 16:
+            readerr, resptext = self.readSerial(bufsize)
+            if readerr:
                 err += (
                     self.logerr + "sendCMD- packet too small, payload may be incomplete"
                 )
                 logging.error(err)
         else:
             # add fake CRC to maintain consistency with other comms
-            resp = self.readSerial(8)
-            if len(resp) < 8:
+            readerr, resp = self.readSerial(8)
+            if readerr:
                 err += self.logerr + "sendCMD- response too small, returning zeros"
                 resptext = "00000000000000000000"
                 logging.error(err)
@@ -181,7 +189,29 @@ class GigE:
 
         return err, resptext
 
-    def arm(self, mode):
+    def sendCMDs(self, pkts):
+        """
+        Submit several packets in a single write and collect all responses with a
+          single read; the board answers packets in order, so response i corresponds to
+          packet i. Must not be used for readoff (SRAM_CTL) packets.
+        Packet communications with FPGA omit CRC suffix, so adds fake CRC bytes to
+          responses
+
+        Args:
+            pkts: list of Packet objects
+
+        Returns:
+            tuple (error, list of response strings)
+        """
+        err = ""
+        self.writeBytes(b"".join(pkt.pktBytes()[0:8] for pkt in pkts))
+        readerr, resp = self.readSerial(8 * len(pkts))
+        if readerr:
+            err += self.logerr + "sendCMDs- response too small, missing bytes are zeros"
+            logging.error(err)
+        return err, [resp[16 * i : 16 * i + 16] + "0000" for i in range(len(pkts))]
+
+    def arm(self, mode=None):
         """
         Puts camera into wait state for trigger. Mode determines source; arm() in
           CameraAssembler defaults to 'Hardware'
@@ -209,7 +239,7 @@ class GigE:
             self.skipError = True
         return err, resp
 
-    def readoff(self, waitOnSRAM, timeout, fast):
+    def readoff(self, waitOnSRAM=None, timeout=0, fast=None):
         """
         Copies image data from board into numpy arrays. The FPGA returns a packet
           without the CRC suffix
@@ -251,7 +281,7 @@ class GigE:
         if fast:
             return data, len(data) // 2, bool(err)
         else:
-            parsed = self.ca.generateFrames(data)
+            parsed = self.ca.generateFrames(data, pooled=True)
             return parsed, len(data) // 2, bool(err)
 
     def writeSerial(self, outstring, timeout=None):
@@ -261,18 +291,28 @@ class GigE:
             outstring: string to write
             timeout: serial timeout in sec (defaults to self.writeTimeout)
 
+        Returns:
+            integer number of bytes written
+        """
+        return self.writeBytes(self.ca.str2bytes(outstring), timeout)
+
+    def writeBytes(self, outbytes, timeout=None):
+        """
+        Transmit bytes to board
+        Args:
+            outbytes: byte string to write
+            timeout: serial timeout in sec (defaults to self.writeTimeout)
+
         Returns:
             integer number of bytes written
         """
         if not timeout:
             timeout = self.writeTimeout
-        outstring = self.ca.str2bytes(outstring)
-        outbuff = C.create_string_buffer(outstring)
-        outbuffp = C.pointer(outbuff)
-        outbufflen = len(outstring)
+        # the library only reads from the buffer, so the byte string is passed as is
+        #   rather than copied into a ctypes buffer first
         writelen = C.c_ulong(0)
         err = self.ZWriteData(
-            self.Connection, outbuffp, outbufflen, C.byref(writelen), timeout
+            self.Connection, outbytes, len(outbytes), C.byref(writelen), timeout
         )
         if err:
             logging.error(self.logerr + "writeSerial error #" + str(err))
@@ -287,22 +327,39 @@ class GigE:
            timeout: serial timeout in sec (defaults to self.readTimeout)
 
         Returns:
-           tuple (error string, string read from serial port)
+           tuple (error string, string read from serial port); bytes not received
+             before the timeout are returned as zeros and reported in the error string
         """
         if not timeout:
             timeout = self.readTimeout
-        inbuff = C.create_string_buffer(size + 1)
-        inbuffp = C.pointer(inbuff)
+        if C.sizeof(self.inbuff) < size:
+            self.inbuff = C.create_string_buffer(size)
         readlen = C.c_ulong(0)
-        err = self.ZReadData(self.Connection, inbuffp, size, C.byref(readlen), timeout)
-        if err:
+        err = self.ZReadData(
+            self.Connection, self.inbuff, size, C.byref(readlen), timeout
+        )
+        readerr = ""
+        if readlen.value < size:
+            # clear any bytes left over from a previous read
+            C.memset(C.addressof(self.inbuff) + readlen.value, 0, size - readlen.value)
+        if err or readlen.value < size:
             if self.skipError:
                 self.skipError = False
             else:
-                logging.error(self.logerr + "readSerial error #" + str(err))
+                readerr = (
+                    self.logerr
+                    + "readSerial error #"
+                    + str(err)
+                    + "; received "
+                    + str(readlen.value)
+                    + " of "
+                    + str(size)
+                    + " bytes"
+                )
+                logging.error(readerr)
             # 32768 = socket error, 32776 = timeout, see comms/ZestETM1/ZestETM1.h line
             #   77 et seq.
-        return self.ca.bytes2str(inbuff.raw)[:-2]
+        return readerr, self.ca.bytes2str(C.string_at(self.inbuff, size))
 
     def openDevice(self):
         """
@@ -369,6 +426,38 @@ class GigE:
             )
             sys.exit(1)
 
+    def setRecvBuffer(self, size):
+        """
+        Request TCP receive buffer size (SO_RCVBUF) for the connection opened by the
+          ZestETM1 library. Larger buffers let the OS keep receiving image data while
+          Python is busy. Note that on Linux an explicit size disables receive buffer
+          autotuning and is capped by net.core.rmem_max. Jumbo frames and interrupt
+          moderation are network adapter settings and must be configured in the OS.
+
+        Args:
+            size: requested buffer size in bytes
+
+        Returns:
+            buffer size reported by the OS in bytes (0 if unable to set)
+        """
+        conn = C.cast(
+            self.Connection, C.POINTER(self.ZESTETM1_CONNECTION_STRUCT)
+        ).contents
+        if conn.Magic != 0xDEADBED1 or self.ca.platform == "Windows":
+            logging.warning(
+                self.logwarn + "setRecvBuffer: unable to access connection socket; "
+                "receive buffer size unchanged"
+            )
+            return 0
+        sock = socket.fromfd(conn.Socket, socket.AF_INET, socket.SOCK_STREAM)
+        try:
+            sock.setsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF, size)
+            actual = sock.getsockopt(socket.SOL_SOCKET, socket.SO_RCVBUF)
+        finally:
+            sock.close()  # closes duplicate descriptor only
+        logging.info(self.loginfo + "receive buffer size: " + str(actual) + " bytes")
+        return actual
+
     def closeDevice(self):
         """
         Close connection to Orange Tree card and free resources
@@ -424,6 +513,18 @@ class GigE:
             ("HardwareVersion", C.c_ulong),
         ]
 
+    class ZESTETM1_CONNECTION_STRUCT(C.Structure):
+        # see ZestETM1/Private.h; only used to reach the socket of the connection
+        _fields_ = [
+            ("Magic", C.c_uint32),
+            ("CardInfo", C.c_void_p),
+            ("Type", C.c_int),
+            ("Target", C.c_ubyte * 16),  # struct sockaddr_in
+            ("Port", C.c_uint16),
+            ("LocalPort", C.c_uint16),
+            ("Socket", C.c_int),
+        ]
+
 
 """
 Copyright (c) 2022, Lawrence Livermore National Security, LLC.  All rights reserved.  
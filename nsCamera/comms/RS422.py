@@ -38,6 +38,7 @@ class RS422:
         sendCMD(pkt) - sends packet object via serial port
         readSerial(size, timeout) - read 'size' bytes from serial port
         writeSerial(cmd) - submits string 'cmd' (assumes string is preformed packet)
+        writeBytes(outbytes) - submits byte string 'outbytes' (preformed packet)
         closeDevice() - close serial connections
     """
 
@@ -61,9 +62,9 @@ class RS422:
         self._par = par  # Parity bit
         self._stop = stop  # Number of stop bits
         self._read_timeout = 1  # default timeout for ordinary packets
+        self._cmd_timeout = 0.05  # timeout for response to a single command packet
         self._write_timeout = 1
         self._datatimeout = 5e7 * self.ca.sensor.nframes / baud  # timeout for data read
-        self.PY3 = sys.version_info > (3,)
         self.skipError = False
         port = ""
         ports = list(serial.tools.list_ports.comports())
@@ -137,6 +138,16 @@ class RS422:
         if not self._ser.is_open:
             logging.critical(self.logcrit + "Unable to open serial connection")
             sys.exit(1)
+        # enlarge the driver receive buffer to hold an entire full-size payload so that
+        #   a stall in the python process during readoff does not overrun it (driver
+        #   buffer sizing is only exposed by pyserial on Windows)
+        if hasattr(self._ser, "set_buffer_size"):
+            try:
+                self._ser.set_buffer_size(rx_size=self.payloadsize + 20)
+            except Exception as e:
+                logging.warning(
+                    self.logwarn + "unable to set serial receive buffer size: " + str(e)
+                )
 
     def serialClose(self):
         """
@@ -155,11 +166,10 @@ class RS422:
         Returns:
             tuple (error, response string)
         """
-        pktStr = pkt.pktStr()
         self._ser.flushInput()
         time.sleep(0.01)  # wait 10 ms in between flushing input and output buffers
         self._ser.flushOutput()
-        self.ca.writeSerial(pktStr)
+        self.writeBytes(pkt.pktBytes())
         err0 = ""
         err = ""
         resp = ""
@@ -167,12 +177,11 @@ class RS422:
 
         if (
             hasattr(self.ca, "board")
-            and pktStr[4] == "0"
-            and pktStr[5:8] == self.ca.board.registers["SRAM_CTL"]
+            and pkt._cmd == "0"
+            and pkt._addr == self.ca.board.registers["SRAM_CTL"]
         ):
-            logging.info(
-                self.loginfo + "Payload size (bytes) = " + str(self.payloadsize)
-            )
+            # formatted by logging only if INFO is enabled (batchAcquire disables it)
+            logging.info("%sPayload size (bytes) = %d", self.loginfo, self.payloadsize)
             crcresp0 = ""
             crcresp1 = ""
             smallresp = ""
@@ -184,7 +193,10 @@ class RS422:
                 )
                 if err:
                     logging.error(
-                        self.logerr + "sendCMD: read payload failed " + pktStr + err
+                        self.logerr
+                        + "sendCMD: read payload failed "
+                        + pkt.pktStr()
+                        + err
                     )
                     self.ca.payloaderror = True
                 else:
@@ -209,7 +221,7 @@ class RS422:
                         err0 = (
                             self.logerr
                             + "sendCMD: "
-                            + pktStr
+                            + pkt.pktStr()
                             + " - payload preface CRC fail"
                         )
                         logging.error(err0)
@@ -217,7 +229,10 @@ class RS422:
                         crcresp1 = resp
                     elif not self.ca.checkCRC(resp[24:]):
                         err0 = (
-                            self.logerr + "sendCMD: " + pktStr + " - payload CRC fail"
+                            self.logerr
+                            + "sendCMD: "
+                            + pkt.pktStr()
+                            + " - payload CRC fail"
                         )
                         logging.error(err0)
                         self.ca.payloaderror = True
@@ -262,20 +277,21 @@ class RS422:
                             )
                     else:
                         logging.info(
-                            self.loginfo + "Retrying download, attempt #" + str(i + 1)
+                            "%sRetrying download, attempt #%d", self.loginfo, i + 1
                         )
                         err = ""
                         err0 = ""
                         self.ca.payloaderror = False
-                        self.ca.writeSerial(pktStr)
+                        self.writeBytes(pkt.pktBytes())
                 else:
                     logging.info(self.loginfo + "Download successful")
                     break
 
         else:
-            time.sleep(0.03)
-            self._ser.timeout = 0.02
-            err, resp = self.readSerial(10)
+            # read() returns as soon as the full response has arrived, so wait via the
+            #   read timeout rather than a fixed sleep (same worst case as the former
+            #   30 ms sleep + 20 ms timeout)
+            err, resp = self.readSerial(10, timeout=self._cmd_timeout)
             if err:
                 logging.error(
                     self.logerr + "sendCMD: readSerial failed (regular packet) " + err
@@ -285,7 +301,7 @@ class RS422:
                 logging.error(err)
         return err, resp
 
-    def arm(self, mode):
+    def arm(self, mode=None):
         """
         Puts camera into wait state for trigger. Mode determines source; arm() in
           CameraAssembler defaults to 'Hardware'
@@ -313,7 +329,7 @@ class RS422:
             self.skipError = True
         return err, resp
 
-    def readoff(self, waitOnSRAM, timeout, fast):
+    def readoff(self, waitOnSRAM=None, timeout=0, fast=None):
         """
         Copies image data from board into numpy arrays
         Args:
@@ -353,10 +369,10 @@ class RS422:
         if fast:
             return read_burst_data, len(read_burst_data) // 2, errortemp
         else:
-            parsed = self.ca.generateFrames(read_burst_data)
+            parsed = self.ca.generateFrames(read_burst_data, pooled=True)
             return parsed, len(read_burst_data) // 2, errortemp
 
-    def writeSerial(self, outstring, timeout):
+    def writeSerial(self, outstring, timeout=None):
         """
         Args:
             outstring: string to write
@@ -364,11 +380,21 @@ class RS422:
         Returns:
             integer length of string written to serial port
         """
+        return self.writeBytes(self.ca.str2bytes(outstring), timeout)
+
+    def writeBytes(self, outbytes, timeout=None):
+        """
+        Args:
+            outbytes: byte string to write
+            timeout: serial timeout in sec
+        Returns:
+            integer length of string written to serial port
+        """
         if timeout:
             self._ser.timeout = timeout
         else:
             self._ser.timeout = self._write_timeout
-        lengthwritten = self._ser.write(self.ca.str2bytes(outstring))
+        lengthwritten = self._ser.write(outbytes)
         self._ser.timeout = self._read_timeout
         return lengthwritten
 
@@ -23,6 +23,28 @@ from collections import OrderedDict
 import numpy as np
 
 
+def readoutColumns():
+    """
+    Column order of Daedalus readout: for each image column, the column of the raw
+      frame that holds it. Pixel pairs from the board are spread across 32-column
+      blocks (lookup from daedlookup.xls), and the blocks are then rearranged.
+
+    Returns:
+        numpy array of 512 column indices
+    """
+    entries = np.arange(256)
+    cols = 32 * (entries % 8) + entries // 8
+    current = np.empty(512, dtype=int)
+    current[cols] = 2 * entries
+    current[cols + 256] = 2 * entries + 1
+    # source block of 'current' for each 32-column block of the image
+    blocks = np.array([10, 11, 6, 5, 8, 9, 13, 1, 4, 7, 12, 14, 15, 0, 2, 3])
+    return current[(32 * blocks[:, None] + np.arange(32)).ravel()]
+
+
+READOUT_COLUMNS = readoutColumns()
+
+
 class daedalus:
     def __init__(self, camassem):
         self.ca = camassem
@@ -326,7 +348,7 @@ class daedalus:
             ("SLOWREADOFF_1", "0"),
         ]
 
-    def setInterlacing(self, ifactor):
+    def setInterlacing(self, ifactor=None):
         """
         Sets interlacing factor. NOTE: if called directly when HFW or ZDT mode is
         active, this will disengage those modes automatically.
@@ -379,8 +401,7 @@ class daedalus:
             bitsrev = regbits[::-1]
             s = [str(i) for i in bitsrev]
             b = "".join(s)  # assemble as binary number for processing
-            hexval = "%x" % int(b, 2)
-            val = hexval.zfill(8)
+            val = "%08x" % int(b, 2)
             err0, _ = self.ca.setRegister(rname, val)
             err1, _ = self.ca.setRegister(lname, val)
             err = err + err0 + err1
@@ -390,7 +411,7 @@ class daedalus:
         self.interlacing = ifactor
         return self.interlacing
 
-    def setHighFullWell(self, flag):
+    def setHighFullWell(self, flag=True):
         """
         Activates High Full Well mode. All frames are acquired simultaneously. Zero Dead
           Time mode and interlacing will be automatically deactivated. NOTE: after
@@ -423,7 +444,7 @@ class daedalus:
             logging.error(self.logerr + "HFW option may not be set correctly ")
         return err
 
-    def setZeroDeadTime(self, flag):
+    def setZeroDeadTime(self, flag=True):
         """
         Activates Zero Dead Time mode. Even rows follow the assigned HST schedule; odd
           rows are acquired while the 'shutter' for the even rows are closed. High Full
@@ -465,7 +486,7 @@ class daedalus:
             logging.error(self.logerr + "ZDT option may not be set correctly ")
         return err
 
-    def setTriggerDelay(self, delayblocks):
+    def setTriggerDelay(self, delayblocks=0):
         """
         NOTE: THIS IS BASED ON AN UNCERTAIN INTERPRETATION OF THE HDD
 
@@ -490,7 +511,7 @@ class daedalus:
         delayed = delayblocks * 0.15
         logging.info(self.loginfo + "Trigger delay = " + str(delayed) + " ns")
 
-    def setTiming(self, side, sequence, delay):
+    def setTiming(self, side=None, sequence=None, delay=None):
         """
         Sets timing registers based on 'sequence.' WARNING: if entire sequence does not
           fit into the 40-bit register space, then the actual timings may differ from
@@ -609,7 +630,7 @@ class daedalus:
                 )
         return err, full40hex
 
-    def setArbTiming(self, side, sequence):
+    def setArbTiming(self, side=None, sequence=None):
         """
         Args:
             side: Hemisphere 'A' or 'B'
@@ -682,7 +703,7 @@ class daedalus:
             )
         return actual
 
-    def getTiming(self, side, actual):
+    def getTiming(self, side=None, actual=None):
         """
         actual = True: returns actual high speed intervals that will be generated by the
           FPGA as list [delay, open0, closed0, open1, closed1, open2, closed2, open3]
@@ -749,7 +770,7 @@ class daedalus:
                 timeoff = gblist[-3][1]
             return side.upper(), timeon, timeoff, delay
 
-    def setManualShutters(self, timing):
+    def setManualShutters(self, timing=None):
         """
         Dummy function; feature is not implemented on Daedalus
 
@@ -789,58 +810,35 @@ class daedalus:
             rows = self.maxheight
         else:
             rows = self.lastrow - self.firstrow + 1
-        parsed = []
-        for frame in frames:
-            current = np.zeros((rows, w), dtype=int)
-            mapped = np.zeros((rows, w), dtype=int)
-            frame = frame.reshape(rows, w)
-
-            for entry in range(int(w / 2)):
-                col = 32 * (entry % 8) + entry // 8  # lookup from daedlookup.xls
-                for row in range(rows):
-                    current[row][col] = frame[row][2 * entry]
-                    current[row][col + 256] = frame[row][2 * entry + 1]
-
-            for row in range(rows):
-                mapped[row][0:32] = current[row][320:352]
-                mapped[row][32:64] = current[row][352:384]
-                mapped[row][64:96] = current[row][192:224]
-                mapped[row][96:128] = current[row][160:192]
-                mapped[row][128:160] = current[row][256:288]
-                mapped[row][160:192] = current[row][288:320]
-                mapped[row][192:224] = current[row][416:448]
-                mapped[row][224:256] = current[row][32:64]
-                mapped[row][256:288] = current[row][128:160]
-                mapped[row][288:320] = current[row][224:256]
-                mapped[row][320:352] = current[row][384:416]
-                mapped[row][352:384] = current[row][448:480]
-                mapped[row][384:416] = current[row][480:512]
-                mapped[row][416:448] = current[row][0:32]
-                mapped[row][448:480] = current[row][64:96]
-                mapped[row][480:512] = current[row][96:128]
-            parsed.append(mapped)
+        # reorder all columns of each frame with one indexing operation
+        parsed = [
+            frame.reshape(rows, w)[:, READOUT_COLUMNS].astype(int) for frame in frames
+        ]
 
         images = self.ca.deInterlace(parsed, self.interlacing)
         flatimages = [x.flatten() for x in images]
         return flatimages
 
-    def reportStatusSensor(self, statusbits):
+    def reportStatusSensor(self, status):
         """
         Print status messages from sensor-specific bits of status register or object
           status flags
 
         Args:
-            statusbits: result of checkStatus()
+            status: result of status() (integer), or of checkStatus() (reversed bit
+              string)
         """
-        if int(statusbits[3]):
+        if isinstance(status, str):
+            status = int(status[::-1], 2)
+        if status & (1 << 3):
             logging.info(self.loginfo + "RSLROWINL detected")
-        if int(statusbits[4]):
+        if status & (1 << 4):
             logging.info(self.loginfo + "RSLROWINR detected")
-        if int(statusbits[12]):
+        if status & (1 << 12):
             logging.info(self.loginfo + "RSLNALLWENR detected")
-        if int(statusbits[15]):
+        if status & (1 << 15):
             logging.info(self.loginfo + "RSLNALLWENL detected")
-        if int(statusbits[16]):
+        if status & (1 << 16):
             logging.info(self.loginfo + "CONFIGHSTDONE detected")
         if self.HFW:
             logging.info(self.loginfo + "High Full Well mode active")
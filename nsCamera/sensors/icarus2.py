@@ -20,6 +20,8 @@ import itertools
 import logging
 from collections import OrderedDict
 
+import numpy as np
+
 
 class icarus2:
     def __init__(self, camassem):
@@ -124,7 +126,7 @@ class icarus2:
             ("HS_TIMING_DATA_ALO", "00006666"),
         ]
 
-    def setInterlacing(self, ifactor):
+    def setInterlacing(self, ifactor=None):
         """
         Dummy function; feature is not implemented on Icarus2
 
@@ -137,7 +139,7 @@ class icarus2:
             )
         return 1
 
-    def setHighFullWell(self, flag):
+    def setHighFullWell(self, flag=True):
         """
         Dummy function; feature is not implemented on Icarus2
         """
@@ -147,7 +149,7 @@ class icarus2:
                 "sensor. "
             )
 
-    def setZeroDeadTime(self, flag):
+    def setZeroDeadTime(self, flag=True):
         """
         Dummy function; feature is not implemented on Icarus2
         """
@@ -157,7 +159,7 @@ class icarus2:
                 "sensor. "
             )
 
-    def setTriggerDelay(self, delayblocks):
+    def setTriggerDelay(self, delayblocks=0):
         """
         Dummy function; feature is not implemented on Icarus2
         """
@@ -167,7 +169,7 @@ class icarus2:
                 "sensor. "
             )
 
-    def setTiming(self, side, sequence, delay):
+    def setTiming(self, side=None, sequence=None, delay=None):
         """
         Sets timing registers based on 'sequence.' WARNING: if entire sequence does not
           fit into the 40-bit register space, then the actual timings may differ from
@@ -284,7 +286,7 @@ class icarus2:
                 )
         return "", full40hex
 
-    def setArbTiming(self, side, sequence):
+    def setArbTiming(self, side=None, sequence=None):
         """
         Set arbitrary high-speed timing sequence. NOTE: Icarus sensors generally cannot
           use 1 ns timing, so all values (besides the delay) should be at least 2 ns
@@ -360,7 +362,7 @@ class icarus2:
             )
         return actual
 
-    def getTiming(self, side, actual):
+    def getTiming(self, side=None, actual=None):
         """
         actual = True: returns actual high speed intervals that will be generated by the
                     FPGA as list [delay, open0, closed0, open1, closed1, open2, closed2,
@@ -428,7 +430,7 @@ class icarus2:
                 timeoff = gblist[-3][1]
             return side.upper(), timeon, timeoff, delay
 
-    def setManualShutters(self, timing):
+    def setManualShutters(self, timing=None):
         """
         Manual shutter timing, seven intervals for each side of the imager given in
           nanoseconds, e.g., [(100,50,100,50,100,50,100),(100,50,100,50,100,50,100)]
@@ -441,7 +443,8 @@ class icarus2:
           to 125 ns))
 
         Args:
-            timing: 14-element list (substructure optional) in nanoseconds
+            timing: 14-element list (substructure optional) or integer numpy array
+              (e.g., shape (2, 7)) in nanoseconds
 
         Returns:
             tuple (error string, response string from final message)
@@ -452,31 +455,40 @@ class icarus2:
                 (100, 50, 100, 50, 100, 50, 100),
             ]
         logging.info(self.loginfo + "Manual shutter sequence: " + str(timing))
-        flattened = self.ca.flatten(timing)
-        if len(flattened) != 14 or not all(type(x) is int for x in flattened):
+        if isinstance(timing, np.ndarray):
+            valid = timing.size == 14 and timing.dtype.kind in "iu"
+            flattened = timing.ravel().tolist()
+        else:
+            flattened = self.ca.flatten(timing)
+            valid = len(flattened) == 14 and all(type(x) is int for x in flattened)
+        if not valid:
             err = self.logerr + "Invalid manual shutter timing list: " + str(timing)
             logging.error(err + "; timing settings unchanged")
             return err, "00000000"
 
-        timecounts = [a // 25 for a in flattened]
-        self.ca.sensmanual = timing
+        self.ca.sensmanual = flattened  # plain list, so truth tests work for arrays
         self.ca.senstiming = {}  # clear HST settings from ca object
 
+        shutterregs = [
+            "W0_INTEGRATION",
+            "W0_INTERFRAME",
+            "W1_INTEGRATION",
+            "W1_INTERFRAME",
+            "W2_INTEGRATION",
+            "W2_INTERFRAME",
+            "W3_INTEGRATION",
+            "W0_INTEGRATION_B",
+            "W0_INTERFRAME_B",
+            "W1_INTEGRATION_B",
+            "W1_INTERFRAME_B",
+            "W2_INTEGRATION_B",
+            "W2_INTERFRAME_B",
+            "W3_INTEGRATION_B",
+        ]
         control_messages = [
-            ("W0_INTEGRATION", "{0:#0{1}x}".format(timecounts[0], 10)[2:10]),
-            ("W0_INTERFRAME", "{0:#0{1}x}".format(timecounts[1], 10)[2:10]),
-            ("W1_INTEGRATION", "{0:#0{1}x}".format(timecounts[2], 10)[2:10]),
-            ("W1_INTERFRAME", "{0:#0{1}x}".format(timecounts[3], 10)[2:10]),
-            ("W2_INTEGRATION", "{0:#0{1}x}".format(timecounts[4], 10)[2:10]),
-            ("W2_INTERFRAME", "{0:#0{1}x}".format(timecounts[5], 10)[2:10]),
-            ("W3_INTEGRATION", "{0:#0{1}x}".format(timecounts[6], 10)[2:10]),
-            ("W0_INTEGRATION_B", "{0:#0{1}x}".format(timecounts[7], 10)[2:10]),
-            ("W0_INTERFRAME_B", "{0:#0{1}x}".format(timecounts[8], 10)[2:10]),
-            ("W1_INTEGRATION_B", "{0:#0{1}x}".format(timecounts[9], 10)[2:10]),
-            ("W1_INTERFRAME_B", "{0:#0{1}x}".format(timecounts[10], 10)[2:10]),
-            ("W2_INTEGRATION_B", "{0:#0{1}x}".format(timecounts[11], 10)[2:10]),
-            ("W2_INTERFRAME_B", "{0:#0{1}x}".format(timecounts[12], 10)[2:10]),
-            ("W3_INTEGRATION_B", "{0:#0{1}x}".format(timecounts[13], 10)[2:10]),
+            (reg, "%08x" % (ns // 25)) for reg, ns in zip(shutterregs, flattened)
+        ]
+        control_messages += [
             ("HS_TIMING_CTL", "00000000"),
             ("MANUAL_SHUTTERS_MODE", "00000001"),
         ]
@@ -520,18 +532,21 @@ class icarus2:
         """
         return frames
 
-    def reportStatusSensor(self, statusbits):
+    def reportStatusSensor(self, status):
         """
         Print status messages from sensor-specific bits of status register
 
         Args:
-            statusbits: result of checkStatus()
+            status: result of status() (integer), or of checkStatus() (reversed bit
+              string)
         """
-        if int(statusbits[3]):
+        if isinstance(status, str):
+            status = int(status[::-1], 2)
+        if status & (1 << 3):
             logging.info(self.loginfo + "W3_Top_L_Edge1 detected")
-        if int(statusbits[4]):
+        if status & (1 << 4):
             logging.info(self.loginfo + "W3_Top_R_Edge1 detected")
-        if int(statusbits[12]):
+        if status & (1 << 12):
             logging.info(self.loginfo + "HST_All_W_En detected")
 
 
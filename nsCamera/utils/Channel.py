@@ -0,0 +1,102 @@
+# -*- coding: utf-8 -*-
+"""
+Channel object is a handle to a single pot or monitor subregister, resolved once
+
+Author: Jeremy Martin Hill (jerhill@llnl.gov)
+
+Copyright (c) 2022, Lawrence Livermore National Security, LLC.  All rights reserved.
+LLNL-CODE-838080
+
+This work was produced at the Lawrence Livermore National Laboratory (LLNL) under
+contract no. DE-AC52-07NA27344 (Contract 44) between the U.S. Department of Energy
+(DOE) and Lawrence Livermore National Security, LLC (LLNS) for the operation of LLNL.
+'nsCamera' is distributed under the terms of the MIT license. All new
+contributions must be made under this license.
+
+Version: 2.1.1  (July 2021)
+"""
+
+
+class Channel:
+    """
+    Handle to a pot or monitor returned by CameraAssembler.channel(name). The alias and
+      subregister lookups, the pot's latch register and value, and the name of the
+      associated monitor are all resolved once for the current board when the channel
+      is created, so repeated calls (e.g., in a parameter sweep) go straight to the
+      resolved registers.
+
+    Example:
+        osc = ca.channel("HST_OSC_CTL")
+        osc.setV(1.45, tune=True)
+        print(osc.getV(), osc.monV())
+    """
+
+    def __init__(self, ca, name, subreg, writable):
+        """
+        Args:
+            ca: parent CameraAssembler object
+            name: resolved subregister name
+            subreg: SubRegister object
+            writable: writable flag of subregister
+        """
+        self.ca = ca
+        self.name = name
+        self.subreg = subreg
+        self.writable = writable
+        self.minV = subreg.minV
+        self.maxV = subreg.maxV
+        self.logerr = self.ca.logerrbase + "[Channel] "
+        self.latch = None
+        if writable:
+            self.latch = ca.potLatch(name)
+        self.monitor = ca.resolveMonitor(name)
+
+    def get(self, errflag=False):
+        """
+        Returns setting of pot scaled to [0,1); see CameraAssembler.getPot
+        """
+        return self.ca.getPot(self.name, errflag)
+
+    def set(self, value=1.0, errflag=False):
+        """
+        Sets pot to 'value' scaled to [0,1) and latches it; see CameraAssembler.setPot
+        """
+        if not self.writable:
+            return self.ca.setPot(self.name, value, errflag)  # reports error
+        value = 0.0 if value < 0 else 1.0 if value > 1 else value
+        setpoint = int(round(value * self.subreg.max_value))
+        err, rval = self.ca.writePot(self.subreg, setpoint, self.latch)
+        if errflag:
+            return err, rval
+        return rval
+
+    def getV(self, errflag=False):
+        """
+        Returns voltage setting of pot; see CameraAssembler.getPotV
+        """
+        return self.ca.getPotV(self.name, errflag)
+
+    def setV(self, voltage, **kwargs):
+        """
+        Sets pot to 'voltage'; keyword arguments (tune, accuracy, etc.) are passed to
+          CameraAssembler.setPotV
+        """
+        return self.ca.setPotV(self.name, voltage, **kwargs)
+
+    def monV(self, errflag=False):
+        """
+        Returns voltage read by associated monitor; see CameraAssembler.getMonV
+        """
+        return self.ca.getMonV(self.monitor, errflag)
+
+
+"""
+Copyright (c) 2022, Lawrence Livermore National Security, LLC.  All rights reserved.
+LLNL-CODE-838080
+
+This work was produced at the Lawrence Livermore National Laboratory (LLNL) under
+contract no. DE-AC52-07NA27344 (Contract 44) between the U.S. Department of Energy
+(DOE) and Lawrence Livermore National Security, LLC (LLNS) for the operation of LLNL.
+'nsCamera' is distributed under the terms of the MIT license. All new
+contributions must be made under this license.
+"""
@@ -0,0 +1,140 @@
+# -*- coding: utf-8 -*-
+"""
+FrameWriter saves acquired frames in background threads so that disk output overlaps
+  with the next acquisition (or with plotting on the main thread)
+
+Author: Jeremy Martin Hill (jerhill@llnl.gov)
+
+Copyright (c) 2022, Lawrence Livermore National Security, LLC.  All rights reserved.
+LLNL-CODE-838080
+
+This work was produced at the Lawrence Livermore National Laboratory (LLNL) under
+contract no. DE-AC52-07NA27344 (Contract 44) between the U.S. Department of Energy
+(DOE) and Lawrence Livermore National Security, LLC (LLNS) for the operation of LLNL.
+'nsCamera' is distributed under the terms of the MIT license. All new
+contributions must be made under this license.
+
+Version: 2.1.1  (July 2021)
+"""
+
+import logging
+import queue
+import threading
+
+
+class FrameWriter:
+    """
+    Runs one worker thread per save function (e.g., ca.saveTiffs, ca.saveNumpys) so
+      that a slow output format does not hold up the others. Frames handed to submit()
+      are queued for every worker; join() waits for all queued saves to finish.
+
+    Plotting is not handed to the workers; matplotlib must run on the main thread.
+
+    If frames come from the CameraAssembler frame pool (see allocateFrameBuffers),
+      submit(frames, release=True) returns their buffer to the pool once every worker
+      has saved them.
+
+    Example:
+        writer = FrameWriter(ca, [ca.saveTiffs, ca.saveNumpys])
+        ca.arm("SOFTWARE")
+        frames, datalen, data_err = ca.readoff()
+        writer.submit(frames)
+        ca.plotFrames(frames)  # runs while frames are being written
+        writer.join()
+    """
+
+    def __init__(self, ca, savers=None, maxqueue=4):
+        """
+        Args:
+            ca: parent CameraAssembler object
+            savers: list of save functions taking (frames, **kwargs), defaults to
+              [ca.saveTiffs, ca.saveNumpys]
+            maxqueue: maximum number of pending submissions per worker; submit() blocks
+              when a worker falls this far behind
+        """
+        self.ca = ca
+        self.logerr = self.ca.logerrbase + "[FW] "
+        if savers is None:
+            savers = [ca.saveTiffs, ca.saveNumpys]
+        self.errs = []
+        self.pending = {}  # id(frames) -> number of workers yet to save them
+        self.lock = threading.Lock()
+        self.queues = []
+        self.threads = []
+        for saver in savers:
+            q = queue.Queue(maxsize=maxqueue)
+            t = threading.Thread(target=self.work, args=(saver, q))
+            t.daemon = True
+            t.start()
+            self.queues.append(q)
+            self.threads.append(t)
+
+    def work(self, saver, q):
+        """
+        Worker loop; calls 'saver' on each queued submission until it receives None
+        """
+        while True:
+            item = q.get()
+            if item is None:
+                break
+            frames, kwargs, release = item
+            try:
+                err = saver(frames, **kwargs)
+            except Exception as e:
+                err = self.logerr + "work: unable to save frames: " + str(e)
+                logging.error(err)
+            if err:
+                self.errs.append(err)
+            if release:
+                with self.lock:
+                    self.pending[id(frames)] -= 1
+                    done = not self.pending[id(frames)]
+                    if done:
+                        del self.pending[id(frames)]
+                if done:
+                    self.ca.releaseFrames(frames)
+
+    def submit(self, frames, release=False, **kwargs):
+        """
+        Queue frames for every worker. A common filename prefix is generated here
+          (unless given) so that all output formats for one acquisition match.
+
+        Args:
+            frames: list of numpy arrays (or text string from fast readoff)
+            release: if True, return the frames' buffer to the CameraAssembler frame
+              pool after all workers have saved them; frames must not be used by the
+              caller afterwards
+            **kwargs: passed to each save function (path, filename, prefix, index)
+        """
+        if kwargs.get("prefix") is None:
+            kwargs["prefix"] = self.ca.timePrefix()
+        if release:
+            with self.lock:
+                self.pending[id(frames)] = len(self.queues)
+        for q in self.queues:
+            q.put((frames, kwargs, release))
+
+    def join(self):
+        """
+        Wait for all queued saves to finish and stop the worker threads
+
+        Returns:
+            accumulated error string
+        """
+        for q in self.queues:
+            q.put(None)
+        for t in self.threads:
+            t.join()
+        return "".join(self.errs)
+
+
+"""
+Copyright (c) 2022, Lawrence Livermore National Security, LLC.  All rights reserved.
+LLNL-CODE-838080
+
+This work was produced at the Lawrence Livermore National Laboratory (LLNL) under
+contract no. DE-AC52-07NA27344 (Contract 44) between the U.S. Department of Energy
+(DOE) and Lawrence Livermore National Security, LLC (LLNS) for the operation of LLNL.
+'nsCamera' is distributed under the terms of the MIT license. All new
+contributions must be made under this license.
+"""
@@ -17,10 +17,8 @@ contributions must be made under this license.
 Version: 2.1.1  (July 2021)
 """
 
-from __future__ import absolute_import
-
 import binascii
-import sys
+import struct
 
 from nsCamera.utils import crc16pure
 
@@ -60,7 +58,6 @@ class Packet:
         payload="",
         crc="",
     ):
-        self.PY3 = sys.version_info > (3,)
         self._preamble = preamble  # 16 bit packet preamble
         self._cmd = str(cmd)  # 4 bit command packet
         self._addr = addr.zfill(3)  # 12 bit address packet
@@ -104,6 +101,23 @@ class Packet:
         out = "".join(stringparts)
         return out
 
+    def pktBytes(self):
+        """
+        Generate binary form of packet, as transmitted to the board
+
+        Returns:
+            packet as byte string
+        """
+        if self._seqID != "":
+            return self.str2bytes(self.pktStr())
+        return struct.pack(
+            ">HHIH",
+            int(self._preamble, 16),
+            int(self._cmd + self._addr, 16),
+            int(self._data, 16),
+            int(self._crc, 16),
+        )
+
     def calculateCRC(self):
         """
         Calculate CRC-CCIT (XModem) (2 bytes) from 8 byte packet for send and rcv
@@ -111,6 +125,12 @@ class Packet:
         Returns:
             CRC as hexadecimal string without '0x'
         """
+        if self._seqID == "":
+            # single command packet: CRC covers command, address, and data fields
+            body = struct.pack(
+                ">HI", int(self._cmd + self._addr, 16), int(self._data, 16)
+            )
+            return "%04x" % crc16pure.crc16xmodem(body)
         preamble = self._preamble
         crc = self._crc
         self._crc = ""
@@ -199,36 +219,10 @@ class Packet:
             rval = ""
         return err, rval
 
-    def str2bytes(self, bstring):
-        """
-        Python-version-agnostic converter of hexadecimal strings to bytes
-
-        Args:
-            bstring: hexadecimal string without '0x'
-
-        Returns:
-            byte string equivalent to input string
-        """
-        if self.PY3:
-            dbytes = binascii.a2b_hex(bstring)
-        else:
-            dbytes = bstring.decode("hex")
-        return dbytes
-
-    def bytes2str(self, bytesequence):
-        """
-        Python-version-agnostic converter of bytes to hexadecimal strings
-
-        Args:
-            bytesequence: sequence of bytes as string (Py2) or bytes (Py3)
-
-        Returns:
-            hexadecimal string representation of 'bytes' without '0x'
-        """
-        estring = binascii.b2a_hex(bytesequence)
-        if self.PY3:
-            estring = str(estring)[2:-1]
-        return estring
+    # hexadecimal string (without '0x') <-> bytes converters, bound directly to the
+    #   builtin implementations
+    str2bytes = staticmethod(binascii.a2b_hex)
+    bytes2str = staticmethod(bytes.hex)
 
 
 """
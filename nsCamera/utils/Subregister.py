@@ -44,6 +44,10 @@ class SubRegister:
         self.width = width
         self.value = value
         self.max_value = 2 ** width - 1  # used to normalize the input values to 1
+        # bit position of LSB and in-place bit mask, for integer access to register
+        self.shift = start_bit - width + 1
+        self.mask = self.max_value << self.shift
+        self.binfmt = "{0:0%db}" % width  # contents as zero-padded binary string
         self.min = 0
         self.max = self.max_value
         self.writable = writable
@@ -16,6 +16,8 @@ contributions must be made under this license.
 Version: 2.1.1  (July 2021)
 """
 
+from .Channel import Channel
+from .FrameWriter import FrameWriter
 from .Packet import Packet
 from .Subregister import SubRegister
 
@@ -27,7 +29,15 @@ try:
 except:
     pass
 
-__all__ = ["SubRegister", "Packet", "GenTec", "Ophir", "FlatField"]
+__all__ = [
+    "SubRegister",
+    "Packet",
+    "Channel",
+    "FrameWriter",
+    "GenTec",
+    "Ophir",
+    "FlatField",
+]
 
 """
 Copyright (c) 2022, Lawrence Livermore National Security, LLC.  All rights reserved.  
@@ -1,6 +1,6 @@
 #!/usr/bin/env python
 """Pure python library for calculating CRC16
-    NOTE: modified slightly to combine Python 2 and Python 3 versions in single file
+    NOTE: modified slightly; Python 3 only
 """
 
 ##############################################################################
@@ -22,7 +22,7 @@
 #
 ##############################################################################
 
-import sys
+import binascii
 
 # table for calculating CRC
 # this particular table was generated using pycrc v0.7.6, http://www.tty1.net/pycrc/
@@ -298,24 +298,23 @@ CRC16_XMODEM_TABLE = [
 
 def _crc16(data, crc, table):
     """Calculate CRC16 using the given table.
-    `data`      - data for calculating CRC, must be a string
+    `data`      - data for calculating CRC, must be bytes
     `crc`       - initial value
     `table`     - table for caclulating CRC (list of 256 integers)
     Return calculated value of CRC
     """
     for byte in data:
-        if sys.version_info > (3,):
-            crc = ((crc << 8) & 0xFF00) ^ table[((crc >> 8) & 0xFF) ^ byte]
-        else:
-            crc = ((crc << 8) & 0xFF00) ^ table[((crc >> 8) & 0xFF) ^ ord(byte)]
+        crc = ((crc << 8) & 0xFF00) ^ table[((crc >> 8) & 0xFF) ^ byte]
 
     return crc & 0xFFFF
 
 
 def crc16xmodem(data, crc=0):
     """Calculate CRC-CCITT (XModem) variant of CRC16.
-    `data`      - data for calculating CRC, must be a string
+    `data`      - data for calculating CRC, must be bytes
     `crc`       - initial value
     Return calculated value of CRC
     """
-    return _crc16(data, crc, CRC16_XMODEM_TABLE)
+    # binascii.crc_hqx computes the same CRC (poly 0x1021, no reflection, no final
+    #   XOR) in C; _crc16 and the table are kept for reference
+    return binascii.crc_hqx(data, crc)
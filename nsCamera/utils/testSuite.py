@@ -16,10 +16,13 @@ contributions must be made under this license.
 Version: 2.1.1  (July 2021)
 """
 
+import argparse
 import logging
 import time
 from collections import OrderedDict
 
+import numpy as np
+
 from nsCamera.CameraAssembler import CameraAssembler
 
 """
@@ -29,14 +32,99 @@ When run from the command line, testSuite accepts the following parameters:
     -s     	name of sensor: 'icarus', 'icarus2', or 'daedalus';	default='icarus'
     -p     	specified port number; default=None
     -i     	specified ip address; default='192.168.1.100'
+    -v     	logging verbosity (0-5) passed to cameraAssembler; default=5
     --batch	run automatically without interaction
     --hw   	wait for hardware triggering  
 """
 
-# TODO: add verbose argument to command line
-
-
-def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=True):
+# Register tables for the register checks: (register name, writable bits)
+
+REGCHECKLIST = (  # read-only, write-only, and self-clearing registers are skipped
+    ("HS_TIMING_DATA_ALO", 0xFFFFFFFF),
+    ("HS_TIMING_DATA_AHI", 0x000000FF),
+    ("HS_TIMING_DATA_BLO", 0xFFFFFFFF),
+    ("HS_TIMING_DATA_BHI", 0x000000FF),
+    ("CTRL_REG", 0x0000000F),
+    ("HST_SETTINGS", 0x00000003),
+    ("DIAG_MAX_CNT_0", 0xFFFF00FF),
+    ("DIAG_MAX_CNT_1", 0xFFFFFFFF),
+    ("TRIGGER_CTL", 0x00000003),
+    ("FPA_ROW_INITIAL", 0x000003FF),
+    ("FPA_ROW_FINAL", 0x000003FF),
+    ("FPA_FRAME_INITIAL", 0x00000003),
+    ("FPA_FRAME_FINAL", 0x00000003),
+    ("FPA_DIVCLK_EN_ADDR", 0x00000001),
+    ("FPA_OSCILLATOR_SEL_ADDR", 0x00000003),
+    ("ADC1_CONFIG_DATA", 0xFFFFFFFF),
+    ("ADC2_CONFIG_DATA", 0xFFFFFFFF),
+    ("ADC3_CONFIG_DATA", 0xFFFFFFFF),
+    ("ADC4_CONFIG_DATA", 0xFFFFFFFF),
+    ("ADC_RESET", 0x0000001F),
+)
+
+SELFCLEAR = (
+    ("HS_TIMING_CTL", 0xFFFFFFFF),  # Read-write registers
+    ("TIMER_CTL", 0xFFFFFFFF),
+    ("ADC_CTL", 0xFFFFFFFF),
+    ("STAT_REG_SRC", 0x00004FFF),  # Read-only registers
+    ("STAT_REG2_SRC", 0xFFFFFFFF),
+)
+
+V1_REGS = (
+    ("ADC_RESET", 0x0000001F),
+    ("ADC5_CONFIG_DATA", 0xFFFFFFFF),
+    ("POT_REG4_TO_1", 0xFFFFFFFF),
+    ("POT_REG8_TO_5", 0xFFFFFFFF),
+    ("POT_REG12_TO_9", 0xFFFFFFFF),
+    ("POT_REG13", 0x000000FF),
+    ("ADC5_PPER", 0x0FFFFFFF),
+    ("LED_GP", 0x000000FF),
+    ("ADC_STANDBY", 0x0000001F),
+    ("TEMP_SENSE_PPER", 0x0FFFFFFF),
+    ("SENSOR_VOLT_CTL", 0x00000001),
+)
+
+V1_SELFCLEAR = (
+    ("POT_CTL", 0x00000001),
+)
+
+V4_REGS = (
+    ("ADC_RESET", 0x0000000F),
+    ("DAC_REG_A_AND_B", 0xFFFFFFFF),
+    ("DAC_REG_C_AND_D", 0xFFFFFFFF),
+    ("DAC_REG_E_AND_F", 0xFFFFFFFF),
+    ("DAC_REG_G_AND_H", 0xFFFFFFFF),
+)
+
+V4_SELFCLEAR = (
+    ("DAC_CTL", 0x00000001),
+    ("SW_COARSE_CONTROL", 0xFFFFFFFF),
+)
+
+ICARUS_REGS = (
+    ("VRESET_WAIT_TIME", 0x7FFFFFFF),
+    ("ICARUS_VER_SEL", 0x00000001),
+    ("MANUAL_SHUTTERS_MODE", 0x00000001),
+    ("W0_INTEGRATION", 0x03FFFFFF),
+    ("W0_INTERFRAME", 0x03FFFFFF),
+    ("W1_INTEGRATION", 0x03FFFFFF),
+    ("W1_INTERFRAME", 0x03FFFFFF),
+    ("W2_INTEGRATION", 0x03FFFFFF),
+    ("W2_INTERFRAME", 0x03FFFFFF),
+    ("W3_INTEGRATION", 0x03FFFFFF),
+    ("W0_INTEGRATION_B", 0x03FFFFFF),
+    ("W0_INTERFRAME_B", 0x03FFFFFF),
+    ("W1_INTEGRATION_B", 0x03FFFFFF),
+    ("W1_INTERFRAME_B", 0x03FFFFFF),
+    ("W2_INTEGRATION_B", 0x03FFFFFF),
+    ("W2_INTERFRAME_B", 0x03FFFFFF),
+    ("W3_INTEGRATION_B", 0x03FFFFFF),
+)
+
+
+def testSuite(
+    board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=True, verbose=5
+):
     """
     Regression testing script to exercise cameraAssembler functions and camera features.
     Comment out entries in 'tests' list to skip component tests
@@ -50,6 +138,7 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
         interactive: if False, does not wait for user input, skips some tests
         swtrigger: if True, uses software triggering, does not wait for external
           triggers
+        verbose: logging verbosity (0-5) passed to cameraAssembler
 
     """
     # Comment out any tests you wish to skip. Irrelevant tests (e.g., Manual Timing if
@@ -68,24 +157,67 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
         "Register R/W",
         "Register self-clear",
         "Register dump",
+        "Frame pool",
         "LED",
         "Manual Timing",
     ]
 
+    def pace(seconds):
+        # pause between phases so output can be followed; skipped in batch mode
+        if interactive:
+            time.sleep(seconds)
+
+    # subregister lookups for statusVerify; the subregister tables do not change during
+    #   a run, so each flag name is resolved only once per camera
+    resolved = {}
+
     def statusVerify(caObject, checklist):
         errs = 0
+        # flags usually share one or two status registers; gather the expected bits
+        #   and mask for each register, read each register just once, and compare
+        #   whole registers, decoding individual flags only on a mismatch
+        fields = OrderedDict()  # register name: [(flag name, subregister, flag)]
+        expected = {}
+        masks = {}
         for stat, flag in checklist:
-            _, check = caObject.getSubregister(stat)
-            if bool(int(check)) is not bool(flag):
+            key = (id(caObject), stat)
+            if key not in resolved:
+                resolved[key] = caObject.resolveSubreg(stat)[1]
+            subreg = resolved[key]
+            if not subreg:
                 errs += 1
-                print("+Error: " + stat + " is not " + str(bool(flag)))
+                print("+Error: " + stat + " is not a valid subregister")
+                continue
+            reg = subreg.register
+            fields.setdefault(reg, []).append((stat, subreg, flag))
+            masks[reg] = masks.get(reg, 0) | subreg.mask
+            expected[reg] = expected.get(reg, 0) | (subreg.mask if flag else 0)
+        regs = list(fields.keys())
+        _, rvals = caObject.getRegisters(regs)
+        for reg, rval in zip(regs, rvals):
+            actual = int(rval, 16)
+            if not (actual ^ expected[reg]) & masks[reg]:
+                continue
+            for stat, subreg, flag in fields[reg]:
+                if bool(actual & subreg.mask) is not bool(flag):
+                    errs += 1
+                    print("+Error: " + stat + " is not " + str(bool(flag)))
         if not errs:
             print("+Status verify passed")
 
+    # report templates, parsed once and reused in the check loops
+    tunereport = "{0:.2f} : actual = {1:.5f} ; delta = {2:.2f} mV".format
+    rwok = "+ {0: <24} - R/W OK".format
+    rwfail = "+ {0: <24} - R/W FAIL: bits 0x{1:08x}".format
+    selfclearok = "+ {0: <17} - self-clear OK".format
+    selfclearfail = "+ {0: <17} - self-clear FAIL: 0x{1:08x}".format
+
+    # single delay for registers to settle after a batch of writes (register checks)
+    settle = 0.1
     errtemp = 0
-    sensorregs = {}
-    boardregs = {}
-    boardselfclear = {}
+    sensorregs = ()
+    boardregs = ()
+    boardselfclear = ()
 
     def test_v1(ca):
         print("\n# LLNL_v1 board-specific checks")
@@ -96,51 +228,26 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
             for i in range(1, 5):
                 for j in range(1, 9):
                     ca.setLED(j, 1)
-                    time.sleep(0.05 * i)
+                    pace(0.05 * i)
                     ca.setLED(j, 0)
 
         if "POT/DAC set & read" in tests:
-            time.sleep(1)
+            pace(1)
             print("\n-Pot check-")
+            desired = np.arange(7) * 0.5
+            checked = desired != 0  # skip v=0, we expect it to be off
             for i in [2, 3, 4, 6, 8]:
                 potname = "POT" + str(i)
                 monname = "MON_CH" + str(i)
                 print("Testing " + potname)
-                temperr = 0
-                for j in range(7):
-                    desired = j * 0.5
-                    potobj = getattr(ca.board, potname)
-                    minvolt = potobj.resolution
-                    ca.setPotV(potname, desired, tune=True)
-                    actual = ca.getMonV(monname)
-                    # skip v=0, we expect it to be off
-                    if abs(desired - actual) > minvolt and bool(desired):
-                        print(
-                            "{0:.2f} : actual = {1:.5f} ; delta = {2:.2f} mV".format(
-                                (1.0 * desired), actual, 1000 * abs(actual - desired)
-                            )
-                        )
-                        temperr = 1
-                if not temperr:
+                minvolt = getattr(ca.board, potname).resolution
+                actual = ca.sweepPotV(potname, desired, monname=monname)
+                bad = (np.abs(desired - actual) > minvolt) & checked
+                for des, act in zip(desired[bad], actual[bad]):
+                    print(tunereport(des, act, 1000 * abs(act - des)))
+                if not bad.any():
                     print("+" + potname + " tunes properly")
 
-        v1regs = OrderedDict(
-            {
-                "ADC_RESET": "0000001F",
-                "ADC5_CONFIG_DATA": "FFFFFFFF",
-                "POT_REG4_TO_1": "FFFFFFFF",
-                "POT_REG8_TO_5": "FFFFFFFF",
-                "POT_REG12_TO_9": "FFFFFFFF",
-                "POT_REG13": "000000FF",
-                "ADC5_PPER": "0FFFFFFF",
-                "LED_GP": "000000FF",
-                "ADC_STANDBY": "0000001F",
-                "TEMP_SENSE_PPER": "0FFFFFFF",
-                "SENSOR_VOLT_CTL": "00000001",
-            }
-        )
-        v1selfclear = OrderedDict({"POT_CTL": "00000001",})
-
         v1restore = [
             ("ADC5_PPER", "001E8480"),
             ("ADC_RESET", "00000000"),
@@ -148,54 +255,35 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
             ("ADC_CTL", "00000010"),
         ]
 
-        return v1regs, v1selfclear, v1restore
+        return V1_REGS, V1_SELFCLEAR, v1restore
 
     def test_v4(ca):
         print("\n# LLNL_v4 board-specific checks")
         if "POT/DAC set & read" in tests:
             print("\n-DAC check-")
+            desired = np.arange(7) * 0.5
+            checked = desired != 0  # skip v=0, we expect it to be off
+            # semi-arbitrary, need to adjust to minimize search time
+            minvolt = 0.005
             for i in ["A", "B", "C", "D", "E", "F", "G", "H"]:
                 dacname = "DAC" + i
                 monname = "MON_CH" + i
                 print("Testing " + dacname)
-                temperr = 0
-                for j in range(7):
-                    desired = j * 0.5
-                    # semi-arbitrary, need to adjust to minimize search time
-                    minvolt = 0.005
-                    ca.setPotV(dacname, desired, tune=True)
-                    actual = ca.getMonV(monname)
-                    # skip v=0, we expect it to be off
-                    if abs(desired - actual) > minvolt and bool(desired):
-                        print(
-                            "{0:.2f} : actual = {1:.5f} ; delta = {2:.2f} mV".format(
-                                (1.0 * desired), actual, 1000 * abs(actual - desired)
-                            )
-                        )
-                        temperr = 1
-                if not temperr:
+                actual = ca.sweepPotV(dacname, desired, monname=monname)
+                bad = (np.abs(desired - actual) > minvolt) & checked
+                for des, act in zip(desired[bad], actual[bad]):
+                    print(tunereport(des, act, 1000 * abs(act - des)))
+                if not bad.any():
                     print("+" + dacname + " tunes properly")
 
-        v4regs = OrderedDict(
-            {
-                "ADC_RESET": "0000000F",
-                "DAC_REG_A_AND_B": "FFFFFFFF",
-                "DAC_REG_C_AND_D": "FFFFFFFF",
-                "DAC_REG_E_AND_F": "FFFFFFFF",
-                "DAC_REG_G_AND_H": "FFFFFFFF",
-            }
-        )
 
-        v4selfclear = OrderedDict(
-            {"DAC_CTL": "00000001", "SW_COARSE_CONTROL": "FFFFFFFF",}
-        )
 
         v4restore = [
             ("ADC_PPER", "001E8480"),
             ("ADC_RESET", "00000000"),
         ]
 
-        return v4regs, v4selfclear, v4restore
+        return V4_REGS, V4_SELFCLEAR, v4restore
 
     def test_icarus(ca, interactive, swtrigger):
         print("\n# Icarus sensor-specific checks")
@@ -214,7 +302,7 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
                 "The next few messages should include two error messages about "
                 "invalid timing sequences "
             )
-            time.sleep(1)
+            pace(1)
             ca.setManualShutters(timing=[(100, 100, 100, 100, 100, 100, 100)])
             ca.setManualShutters(
                 timing=[
@@ -222,7 +310,7 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
                     (100, 100, 100, 100, 100, 100, 100),
                 ]
             )
-            time.sleep(1)
+            pace(1)
 
             print("\n-Testing manual shutter acquisition-")
             if swtrigger:
@@ -309,36 +397,13 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
                         "reinitialization "
                     )
 
-        icarusregs = OrderedDict(
-            {
-                "VRESET_WAIT_TIME": "7FFFFFFF",
-                "ICARUS_VER_SEL": "00000001",
-                "MANUAL_SHUTTERS_MODE": "00000001",
-                "W0_INTEGRATION": "03FFFFFF",
-                "W0_INTERFRAME": "03FFFFFF",
-                "W1_INTEGRATION": "03FFFFFF",
-                "W1_INTERFRAME": "03FFFFFF",
-                "W2_INTEGRATION": "03FFFFFF",
-                "W2_INTERFRAME": "03FFFFFF",
-                "W3_INTEGRATION": "03FFFFFF",
-                "W0_INTEGRATION_B": "03FFFFFF",
-                "W0_INTERFRAME_B": "03FFFFFF",
-                "W1_INTEGRATION_B": "03FFFFFF",
-                "W1_INTERFRAME_B": "03FFFFFF",
-                "W2_INTEGRATION_B": "03FFFFFF",
-                "W2_INTERFRAME_B": "03FFFFFF",
-                "W3_INTEGRATION_B": "03FFFFFF",
-            }
-        )
-
         if ca.sensorname == "icarus":
-            icarusregs["VRESET_HIGH_VALUE"] = "000000FF"
-
-        return icarusregs
+            return ICARUS_REGS + (("VRESET_HIGH_VALUE", 0x000000FF),)
+        return ICARUS_REGS
 
     def test_daedalus(ca, interactive, swtrigger):
         print("\n# Daedalus sensor-specific checks")
-        daedalusregs = {}  # TODO: add daedalus registers when available
+        daedalusregs = ()  # TODO: add daedalus registers when available
         return daedalusregs
 
     print("-Initial setup-")
@@ -346,7 +411,7 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
         commname=comm,
         boardname=board,
         sensorname=sensor,
-        verbose=5,
+        verbose=verbose,
         port=portNum,
         ip=ipAdd,
     )
@@ -379,11 +444,11 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
                 ("STAT_ARMED", 1),
             ],
         )
-        time.sleep(1)
+        pace(1)
         print("\n-Testing Disarm-")
         ca.disarm()
         statusVerify(ca, [("STAT_ARMED", 0)])
-        time.sleep(1)
+        pace(1)
 
     # HIGH SPEED TIMING & ACQUISITION
     if "HST setting" in tests:
@@ -410,21 +475,21 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
 
         ca.setTiming("B", (10, 10), 0)
 
-        time.sleep(1)
+        pace(1)
         print(
             "The next few messages should include a warning about inter-frame timing:"
         )
-        time.sleep(1)
+        pace(1)
         ca.setTiming("A", (9, 8), 1)
         print(
             "The next few messages should include a error message regarding timing "
             "sequence: "
         )
-        time.sleep(1)
+        pace(1)
         ca.setTiming("A", (15, 15), 15)
 
         statusVerify(ca, [("STAT_HSTCONFIGURED", 1), ("MANSHUT_MODE", 0)])
-        time.sleep(1)
+        pace(1)
 
     # ca.setInterlacing(2)  # TODO: sensor-specific testing?
 
@@ -587,15 +652,18 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
     if "Timer" in tests:
         print("Checking on-board timer reset")
         ca.resetTimer()
-        ztime = ca.getTimer()
+    # the comms link carries one exchange at a time, so the timer and temperature are
+    #   fetched together in a single exchange rather than from concurrent threads
+    ztime, temp, _ = ca.snapshot()
+    if "Timer" in tests:
         if not ztime:
             print("+Timer reset check successful")
         else:
             print("+Timer reset failed, timer reads " + str(ztime))
         statusVerify(ca, [("STAT_TIMERCOUNTERRESET", 1)])
 
-    print("Temperature sensor reading: " + str(ca.getTemp()))
-    time.sleep(1)
+    print("Temperature sensor reading: " + str(temp))
+    pace(1)
 
     if ca.boardname == "llnl_v1":
         ca.potsdacsconfigured = "STAT_POTSCONFIGURED"
@@ -609,96 +677,111 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
         for a in (0, 0.05, 0.15, 0.25, 0.5, 0.75, 1, 3, 3.5):
             ca.setPotV("VRST", voltage=a, tune=True)
             actual = ca.getMonV("VRST")
-            print(
-                "{0:.2f} : actual = {1:.5f} ; delta = {2:.2f} mV".format(
-                    (1.0 * a), actual, 1000 * abs(actual - a)
-                )
-            )
+            print(tunereport(a, actual, 1000 * abs(actual - a)))
 
     if "Register R/W" in tests:
         print("\n\n-Verifying register read/writes-\n")
-        regchecklist = OrderedDict(
-            {  # register name: writable bits
-                # read-only, write-only, and self-clearing registers are skipped
-                "HS_TIMING_DATA_ALO": "FFFFFFFF",
-                "HS_TIMING_DATA_AHI": "000000FF",
-                "HS_TIMING_DATA_BLO": "FFFFFFFF",
-                "HS_TIMING_DATA_BHI": "000000FF",
-                "CTRL_REG": "0000000F",
-                "HST_SETTINGS": "00000003",
-                "DIAG_MAX_CNT_0": "FFFF00FF",
-                "DIAG_MAX_CNT_1": "FFFFFFFF",
-                "TRIGGER_CTL": "00000003",
-                "FPA_ROW_INITIAL": "000003FF",
-                "FPA_ROW_FINAL": "000003FF",
-                "FPA_FRAME_INITIAL": "00000003",
-                "FPA_FRAME_FINAL": "00000003",
-                "FPA_DIVCLK_EN_ADDR": "00000001",
-                "FPA_OSCILLATOR_SEL_ADDR": "00000003",
-                "ADC1_CONFIG_DATA": "FFFFFFFF",
-                "ADC2_CONFIG_DATA": "FFFFFFFF",
-                "ADC3_CONFIG_DATA": "FFFFFFFF",
-                "ADC4_CONFIG_DATA": "FFFFFFFF",
-                "ADC_RESET": "0000001F",
-            }
-        )
 
-        regchecklist.update(sensorregs)
-        regchecklist.update(boardregs)
+        # board entries override common entries for the same register
+        masks = OrderedDict(REGCHECKLIST + sensorregs + boardregs)
+        regs = list(masks.keys())
+        checkvals = np.array([0x00000000, 0xFFFFFFFF], dtype=np.uint32)
 
-        checkvals = ["00000000", "FFFFFFFF"]
+        # test strings for every check value (rows) and register (columns)
+        teststrings = np.char.mod(
+            "%08x",
+            np.bitwise_and.outer(checkvals, np.array(list(masks.values()), np.uint32)),
+        )
 
-        for reg, mask in regchecklist.items():
-            temperr = 0
-            for val in checkvals:
-                valmasked = "{0:0=8x}".format(int(val, 16) & int(mask, 16))
-                if temperr:
-                    continue
-                if not ca.checkRegSet(reg, valmasked):
-                    temperr = 1
-                    continue
-            if not temperr:
-                print("+ {: <24} - R/W OK".format(reg))
+        # check all registers together for each value; registers that fail are
+        #   reported with the mismatched bits and not checked again
+        failed = {}
+        for row in teststrings:
+            checks = [(reg, test) for reg, test in zip(regs, row) if reg not in failed]
+            diffs = ca.checkRegSets(checks, settle, detail=True)
+            for (reg, _), diff in zip(checks, diffs):
+                if diff:
+                    failed[reg] = diff
+        for reg in regs:
+            if reg in failed:
+                print(rwfail(reg, failed[reg]))
+            else:
+                print(rwok(reg))
 
         ca.submitMessages(boardrestore)
 
     if "Register self-clear" in tests:
-        time.sleep(1)
+        pace(1)
         print("\n\n-Verifying self-clearing registers-\n")
 
-        selfclear = OrderedDict(
-            {  # register name: writable bits
-                "HS_TIMING_CTL": "FFFFFFFF",  # Read-write registers
-                "TIMER_CTL": "FFFFFFFF",
-                "ADC_CTL": "FFFFFFFF",
-                "STAT_REG_SRC": "00004FFF",  # Read-only registers
-                "STAT_REG2_SRC": "FFFFFFFF",
-            }
-        )
+        # the tables have no registers in common, so the tuples are used as they are
+        selfclear = SELFCLEAR + boardselfclear
 
-        selfclear.update(boardselfclear)
+        # set and read all registers together, then read them back again after they
+        #   have had time to clear
+        regs = [reg for reg, _ in selfclear]
+        ca.setRegisters([(reg, "FFFFFFFF") for reg in regs])
+        ca.getRegisters(regs)
+        time.sleep(settle)
+        _, resps = ca.getRegisters(regs)
 
-        for reg, mask in selfclear.items():
-            ca.setRegister(reg, "FFFFFFFF")
-            ca.getRegister(reg)
-            time.sleep(0.1)
-            _, resp = ca.getRegister(reg)
-            masked = int(resp, 16) & int(mask, 16)
+        for (reg, mask), resp in zip(selfclear, resps):
+            masked = int(resp, 16) & mask
 
             if not masked:
+                print(selfclearok(reg))
+            else:
+                print(selfclearfail(reg, masked))
 
-                print("+ {: <17} - self-clear OK".format(reg))
+        ca.submitMessages(boardrestore)
+
+    if "Frame pool" in tests and swtrigger:
+        pace(1)
+        print("\n\n-Checking frame buffer pool-\n")
+
+        # the pool must keep its size over repeated acquisitions, including when the
+        #   frames do not use its buffers: padded rows, a frame count that no longer
+        #   matches the buffers, or a sensor that copies while parsing (daedalus)
+        # (label, setting applied before allocating, setting applied after allocating)
+        modes = [
+            ("full frames", None, None),
+            (
+                "padded rows",
+                lambda: ca.setRows(0, ca.sensor.maxheight // 2, fullsize=True),
+                None,
+            ),
+            (
+                "changed frame count",
+                None,
+                lambda: ca.setFrames(ca.sensor.minframe, ca.sensor.minframe),
+            ),
+        ]
+        for label, before, after in modes:
+            if before:
+                before()
+            ca.allocateFrameBuffers(2)
+            if after:
+                after()
+            for _ in range(3):
+                ca.arm("Software")
+                frames, datalen, data_err = ca.readoff(waitOnSRAM=True)
+                ca.releaseFrames(frames)
+            if len(ca.framepool) == 2:
+                print("+Frame pool kept its buffers with " + label)
             else:
                 print(
-                    "+ {: <17} - self-clear FAIL: ".format(reg)
-                    + "0x"
-                    + "{0:0=8x}".format(masked)
+                    "+Frame pool LOST buffers with "
+                    + label
+                    + "; "
+                    + str(len(ca.framepool))
+                    + " of 2 remain"
                 )
-
-        ca.submitMessages(boardrestore)
+            ca.setRows()
+            ca.setFrames()
+        ca.framepool = []  # leave readoff allocating new frames
 
     if "Register dump" in tests:
-        time.sleep(1)
+        pace(1)
         print("\n\n-Register dump-\n")
         print("\n".join(ca.dumpRegisters()))
 
@@ -708,8 +791,6 @@ def testSuite(board, comm, sensor, portNum, ipAdd, interactive=True, swtrigger=T
 
 
 if __name__ == "__main__":
-    import argparse
-
     parser = argparse.ArgumentParser()
 
     parser.add_argument(
@@ -734,11 +815,24 @@ if __name__ == "__main__":
         help="name of sensor: 'icarus', 'icarus2', or 'daedalus'",
     )
     parser.add_argument(
-        "-p", action="store", dest="portNum", default=None, help="specified port number"
+        "-p",
+        action="store",
+        dest="portNum",
+        type=int,
+        default=None,
+        help="specified port number",
     )
     parser.add_argument(
         "-i", action="store", dest="ipAdd", default=None, help="specified ip address"
     )
+    parser.add_argument(
+        "-v",
+        action="store",
+        dest="verbose",
+        type=int,
+        default=5,
+        help="logging verbosity (0-5)",
+    )
     parser.add_argument(
         "--batch", action="store_true", help="run automatically without interaction"
     )
@@ -756,6 +850,7 @@ if __name__ == "__main__":
         sensor=args.sensor,
         portNum=args.portNum,
         ipAdd=args.ipAdd,
+        verbose=args.verbose,
     )
 
 """
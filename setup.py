@@ -49,9 +49,9 @@ setup(
         'Operating System :: MacOS :: MacOS X',
         'Operating System :: Microsoft :: Windows',
         'Operating System :: POSIX',
-        "Programming Language :: Python :: 2",
         "Programming Language :: Python :: 3",
     ],
+    python_requires=">=3",
 )
 
 """